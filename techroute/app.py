@@ -11,6 +11,7 @@ import logging
 from . import configuration
 from .localization import LocalizationManager
 from .controller import TechRouteController
+from .network import shutdown_probe_executor
 from .ui.app_ui import AppUI
 from .events import AppActions, AppStateModel
 
@@ -65,6 +66,11 @@ class MainApp:
 
 
 
+    def shutdown(self):
+        """Stops background work once the main loop has exited."""
+        self.controller.shutdown()
+        shutdown_probe_executor()
+
     def _set_icon(self):
         """Sets the application icon based on the OS."""
         try:
@@ -83,6 +89,8 @@ class MainApp:
 
     def _process_controller_queue(self):
         """Periodically tells the controller to process its event queue."""
+        # Apply callbacks raised on worker threads before this tick's results
+        self.ui.drain_ui_queue()
         if self.actions:
             self.actions.process_queue()
         self.root.after(100, self._process_controller_queue)
@@ -105,3 +113,4 @@ def main():
     app = MainApp(root)
     logging.info("MainApp initialized.")
     root.mainloop()
+    app.shutdown()
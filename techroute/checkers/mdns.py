@@ -8,7 +8,7 @@ import threading
 import time
 import logging
 
-from .base import BaseChecker, CheckResult
+from .base import BaseChecker, CheckResult, udp_send_receive
 
 try:
     from zeroconf import ServiceBrowser, ServiceListener, Zeroconf  # type: ignore
@@ -118,8 +118,6 @@ class _MDNSMonitor:
             return False
 
     def _send_qu_ptr(self, timeout: float) -> bool:
-        from .base import udp_send_receive
-
         def _enc_qname(name: str) -> bytes:
             out = bytearray()
             for part in [p for p in name.strip('.').split('.') if p]:
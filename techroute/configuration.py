@@ -20,10 +20,17 @@ UDP_PORTS: List[int] = [161, 427, 3702, 5353]
 DEFAULT_CONFIG: Dict[str, Any] = {
     'ping_interval_seconds': 3,
     'port_check_timeout_seconds': 1,
+    # How often the Local Services indicators re-probe this machine. The
+    # interval doubles while nothing changes, up to the max, and drops back
+    # to the base rate as soon as a port changes state.
+    'local_services_refresh_seconds': 2,
+    'local_services_max_refresh_seconds': 60,
     # UI preferences
     'ui_theme': 'System',            # Options: System, Light, Dark
     'language': 'System',            # Options: System, or a language code like 'en', 'es', 'de'
     'tcp_port_readability': 'Numbers',   # Options: Numbers, Simple
+    # Show input errors in modal dialogs instead of the status bar.
+    'strict_dialogs': False,
     'window_settings': {
         'width_percentage': 110,
     },
@@ -18,7 +18,7 @@ from .checkers.mdns import MDNSChecker
 from .checkers.slp import SLPChecker
 from .checkers.wsdiscovery import WSDiscoveryChecker
 from .checkers.snmp_checker import SNMPChecker
-from .ui.types import AppState, ControllerCallbacks
+from .ui.types import AppState, ControllerCallbacks, StatusUpdatePayload
 from .events import AppActions, AppStateModel
 from dataclasses import asdict
 from .models import PingResult, TargetStatus, PortStatus
@@ -167,11 +167,18 @@ class TechRouteController:
         """Returns the gateway IP address if available."""
         return self.network_info.get('gateway')
 
-    def process_network_updates(self):
-        """Processes network info updates from the queue."""
+    def process_network_updates(self) -> bool:
+        """Processes network info updates from the queue; returns True if the info changed."""
         try:
             info = self.network_info_queue.get_nowait()
+            # Only the newest snapshot matters if several queued up between polls
+            while True:
+                try:
+                    info = self.network_info_queue.get_nowait()
+                except Empty:
+                    break
             logging.info(f"Processing network update from queue: {info}")
+            changed = info != self.network_info
             self.network_info = info
             if self._network_info_callback:
                 logging.info(f"Calling network info callback with: {info}")
@@ -182,8 +189,9 @@ class TechRouteController:
                 self.ui.on_network_info_update(info)
             else:
                 logging.warning("No network info callback registered")
+            return changed
         except Empty:
-            pass
+            return False
 
     def get_state(self) -> AppState:
         """Returns the current application state."""
@@ -194,6 +202,7 @@ class TechRouteController:
         self.config = new_config
         tcp_ports = new_config.get('default_ports_to_check', configuration.TCP_PORTS)
         self.parser.default_ports = list(dict.fromkeys(tcp_ports))
+        self.parser.clear_cache()
         configuration.save_config(self.config)
 
     def process_queue(self):
@@ -243,15 +252,15 @@ class TechRouteController:
                 if ps.protocol == "UDP" and ps.service_name
             }
 
-            update_payloads.append({
-                "original_string": original_string,
-                "status": status_str,
-                "color": color,
-                "latency_str": latency_str,
-                "port_statuses": port_statuses_dict,
-                "web_port_open": target_status.web_port_open,
-                "udp_service_statuses": udp_service_statuses_dict
-            })
+            update_payloads.append(StatusUpdatePayload(
+                original_string=original_string,
+                status=status_str,
+                color=color,
+                latency_str=latency_str,
+                port_statuses=port_statuses_dict,
+                web_port_open=target_status.web_port_open,
+                udp_service_statuses=udp_service_statuses_dict
+            ))
         
         if update_payloads:
             self.ui.on_status_update(update_payloads)
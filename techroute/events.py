@@ -30,7 +30,7 @@ class AppActions:
         self.get_gateway_ip: Callable[[], Optional[str]] = lambda: None
         self.get_web_ui_url: Callable[[str, Optional[int]], Optional[str]] = lambda *args: None
         self.get_all_web_ui_urls: Callable[[], List[str]] = lambda: []
-        self.process_network_updates: Callable[[], None] = lambda: None
+        self.process_network_updates: Callable[[], bool] = lambda: False
         self.process_queue: Callable[[], None] = lambda: None
         self.update_config: Callable[[Dict[str, Any]], None] = lambda *args: None
         self.get_browser_command: Callable[[], Dict[str, Any]] = lambda: {}
@@ -1,3 +1,4 @@
+import functools
 import gettext
 import locale
 import os
@@ -55,7 +56,12 @@ class LocalizationManager:
         Creates a wrapper around a translator that handles '&' mnemonics.
         The original string with '&' is translated, and then the '&' is removed
         from the final string returned to the UI widget.
+
+        Results are memoized: UI strings are a small fixed set that is
+        looked up again on every state change, and a new translator (with a
+        fresh cache) is built whenever the language changes.
         """
+        @functools.lru_cache(maxsize=512)
         def mnemonic_translator(s: str) -> str:
             translated = translator(s)
             return translated
@@ -2,7 +2,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
-@dataclass
+# Slotted: a PortStatus per port and a PingResult per target are created on
+# every poll, and the controller reads their fields on the hot merge path.
+
+@dataclass(slots=True)
 class PortStatus:
     """Represents the status of a single port."""
     port: int
@@ -10,7 +13,7 @@ class PortStatus:
     status: str    # "Open" or "Closed"
     service_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class PingResult:
     """Represents the result of a single ping and port scan operation from a worker."""
     original_string: str
@@ -18,7 +21,7 @@ class PingResult:
     latency_ms: Optional[float]
     port_statuses: List[PortStatus] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class TargetStatus:
     """Represents the complete, canonical status of a single target."""
     ip: str
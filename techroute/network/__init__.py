@@ -5,7 +5,9 @@ Network-related utilities for TechRoute.
 from .browser import find_browser_command, open_browser_with_url, open_browser_with_error_handling
 from .discovery import get_network_info, clear_network_info_cache
 from .ping import ping_worker
-from .utils import check_tcp_port
+from .utils import (
+    check_tcp_port, check_tcp_ports, get_probe_executor, has_ipv6_loopback, shutdown_probe_executor,
+)
 
 __all__ = [
     "find_browser_command",
@@ -15,4 +17,8 @@ __all__ = [
     "clear_network_info_cache",
     "ping_worker",
     "check_tcp_port",
+    "check_tcp_ports",
+    "get_probe_executor",
+    "has_ipv6_loopback",
+    "shutdown_probe_executor",
 ]
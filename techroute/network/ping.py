@@ -12,11 +12,13 @@ import subprocess
 import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass
 
+from ..checkers import get_udp_service_registry
 from ..models import PingResult, PortStatus
-from .utils import _cached_resolve_host, check_tcp_port
+from .utils import _cached_resolve_host, check_tcp_ports
 
 @dataclass
 class ICMPPacket:
@@ -114,6 +116,14 @@ def ping_worker(
 
     pinger = ICMPPinger(timeout=1.0)
 
+    # Each worker fans its own UDP service probes out, one thread per service,
+    # so a poll waits for the slowest probe whatever the number of targets
+    registry = get_udp_service_registry()
+    udp_ports_to_check = [p for p in app_config.get('udp_services_to_check', []) if p in registry]
+    udp_executor = ThreadPoolExecutor(
+        max_workers=len(udp_ports_to_check), thread_name_prefix="udp-probe"
+    ) if udp_ports_to_check else None
+
     def _perform_check() -> PingResult:
         """Performs all checks (ping, TCP, UDP) and returns a PingResult."""
         port_results: List[PortStatus] = []
@@ -122,22 +132,21 @@ def ping_worker(
         
         # TCP port checks
         if ports:
-            for port in ports:
-                status = check_tcp_port(ip, port, port_timeout)
+            for port, status in check_tcp_ports(ip, ports, port_timeout).items():
                 port_results.append(PortStatus(port=port, protocol="TCP", status=status))
 
         # UDP service checks
-        udp_ports_to_check = app_config.get('udp_services_to_check', [])
-        if udp_ports_to_check:
-            from ..checkers import get_udp_service_registry
-            registry = get_udp_service_registry()
+        if udp_executor is not None:
+            udp_timeout = max(0.5, min(2.0, port_timeout))
+            # Submit every probe first so the total wait is the slowest check, not the sum
+            pending = []
             for port in udp_ports_to_check:
-                if port not in registry:
-                    continue
-                
                 service_name, checker = registry[port]
+                pending.append((port, service_name, udp_executor.submit(checker.check, ip, timeout=udp_timeout)))
+
+            for port, service_name, future in pending:
                 try:
-                    res = checker.check(ip, timeout=max(0.5, min(2.0, port_timeout)))
+                    res = future.result()
                     status = "Open" if res and res.available else "Closed"
                 except Exception:
                     status = "Closed"
@@ -150,17 +159,21 @@ def ping_worker(
             port_statuses=port_results
         )
 
-    # Perform an initial check immediately
-    update_queue.put(_perform_check())
+    try:
+        # Perform an initial check immediately
+        update_queue.put(_perform_check())
 
-    if on_first_check_done:
-        on_first_check_done()
+        if on_first_check_done:
+            on_first_check_done()
 
-    while not stop_event.is_set():
-        if ping_interval > 0:
-            stop_event.wait(timeout=ping_interval)
-        
-        if stop_event.is_set():
-            break
+        while not stop_event.is_set():
+            if ping_interval > 0:
+                stop_event.wait(timeout=ping_interval)
+            
+            if stop_event.is_set():
+                break
 
-        update_queue.put(_perform_check())
+            update_queue.put(_perform_check())
+    finally:
+        if udp_executor is not None:
+            udp_executor.shutdown(wait=False)
@@ -1,9 +1,42 @@
 """
 Core network utility functions.
 """
+import errno
+import selectors
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import List, Optional, Tuple, cast
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+
+# connect_ex results meaning "non-blocking connect started"; Windows reports
+# WSAEWOULDBLOCK, which differs from its errno.EWOULDBLOCK.
+_CONNECT_IN_PROGRESS = frozenset(
+    (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, 'WSAEWOULDBLOCK', 10035))
+)
+
+# Dedicated to the local-services checks, so their short loopback probes never
+# queue behind the ping workers' remote ones. One TCP batch per loopback
+# address plus one probe per UDP discovery service and address fits at once.
+_PROBE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PROBE_EXECUTOR_LOCK = threading.Lock()
+
+def get_probe_executor() -> ThreadPoolExecutor:
+    """Returns the local-services probe pool, creating it on first use."""
+    global _PROBE_EXECUTOR
+    if _PROBE_EXECUTOR is None:
+        with _PROBE_EXECUTOR_LOCK:
+            if _PROBE_EXECUTOR is None:
+                _PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=10, thread_name_prefix="local-probe")
+    return _PROBE_EXECUTOR
+
+def shutdown_probe_executor() -> None:
+    """Stops the local-services probe pool, dropping probes that have not started."""
+    with _PROBE_EXECUTOR_LOCK:
+        if _PROBE_EXECUTOR is not None:
+            # Kept in place: later submits fail fast instead of starting a new pool
+            _PROBE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 @lru_cache(maxsize=128)
 def _is_ip_literal(host: str) -> Tuple[bool, Optional[int]]:
@@ -19,6 +52,18 @@ def _is_ip_literal(host: str) -> Tuple[bool, Optional[int]]:
     except OSError:
         return False, None
 
+@lru_cache(maxsize=1)
+def has_ipv6_loopback() -> bool:
+    """Returns True if ::1 is usable here; checked once per process."""
+    if not socket.has_ipv6:
+        return False
+    try:
+        with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as sock:
+            sock.bind(("::1", 0))
+        return True
+    except OSError:
+        return False
+
 @lru_cache(maxsize=128)
 def _cached_resolve_host(host: str) -> List[Tuple[int, str, int, int]]:
     """Resolves a hostname to a list of addresses, caching the result."""
@@ -80,3 +125,62 @@ def _check_port(host: str, port: int, timeout: float) -> str:
 def check_tcp_port(host: str, port: int, timeout: float) -> str:
     """Public helper to check a TCP port."""
     return _check_port(host, port, timeout)
+
+def _connect_batch(family: int, ip: str, flowinfo: int, scopeid: int, ports: List[int], timeout: float) -> Set[int]:
+    """Starts non-blocking connects to every port and returns those that complete."""
+    opened: Set[int] = set()
+    socks: List[socket.socket] = []
+    with selectors.DefaultSelector() as sel:
+        try:
+            for port in ports:
+                try:
+                    sock = socket.socket(family, socket.SOCK_STREAM)
+                except OSError:
+                    continue
+                socks.append(sock)
+                sock.setblocking(False)
+                sockaddr = (ip, port) if family == socket.AF_INET else (ip, port, flowinfo, scopeid)
+                err = sock.connect_ex(sockaddr)
+                if err == 0:
+                    opened.add(port)
+                elif err in _CONNECT_IN_PROGRESS:
+                    sel.register(sock, selectors.EVENT_WRITE, port)
+
+            # One wait for the whole batch; a socket turns writable once its
+            # connect finishes, and SO_ERROR tells success from refusal.
+            deadline = time.monotonic() + timeout
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _events in sel.select(remaining):
+                    sel.unregister(key.fileobj)
+                    sock = cast(socket.socket, key.fileobj)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        opened.add(key.data)
+        finally:
+            for sock in socks:
+                sock.close()
+    return opened
+
+def check_tcp_ports(host: str, ports: Iterable[int], timeout: float) -> Dict[int, str]:
+    """Checks several TCP ports on a host at once.
+
+    All connects are in flight together, so the wall time is about one
+    timeout per address rather than one per closed port.
+    """
+    ports = list(ports)
+    addrs = _cached_resolve_host(host)
+    if not addrs:
+        return {port: "Hostname Error" for port in ports}
+
+    results = {port: "Closed" for port in ports}
+    pending = ports
+    for family, ip, flowinfo, scopeid in addrs:
+        if not pending:
+            break
+        opened = _connect_batch(family, ip, flowinfo, scopeid, pending, timeout)
+        for port in opened:
+            results[port] = "Open"
+        pending = [port for port in pending if port not in opened]
+    return results
@@ -2,19 +2,51 @@
 Handles parsing and validation of network targets.
 """
 from __future__ import annotations
+import functools
 import ipaddress
-from typing import Dict, Any, List, Tuple
+import re
+import sys
+from typing import Dict, Any, List, Optional, Tuple
+
+# One pass over a target line: "[v6]:ports", something shaped like a bare IPv6
+# literal (two or more colons, optional %scope), or "host[:ports]" for
+# hostnames and IPv4.
+_HOST_RE = re.compile(r"""
+    ^(?:
+        \[(?P<bracketed>[^\]]*)\].*
+      | (?P<ipv6>[0-9A-Fa-f.]*:[0-9A-Fa-f.]*:[0-9A-Fa-f:.]*(?:%.+)?)
+      | (?P<host>[^:]*)(?::.*)?
+    )$
+""", re.VERBOSE | re.DOTALL)
 
 class TargetParser:
     """Parses and validates target strings."""
 
     def __init__(self, default_ports: List[int]):
         self.default_ports = default_ports
+        # (input text, default ports it was parsed with, targets) from the last
+        # successful parse; Stop/Start on unchanged input skips re-validation.
+        self._parsed_cache: Optional[Tuple[str, Tuple[int, ...], List[Dict[str, Any]]]] = None
 
     def parse_and_validate_targets(self, ip_string: str) -> List[Dict[str, Any]]:
         """
         Parses a string of IPs/hostnames and ports, validating each and removing duplicates.
         """
+        default_ports = tuple(self.default_ports)
+        cached = self._parsed_cache
+        if cached is not None and cached[0] == ip_string and cached[1] == default_ports:
+            # Fresh copies so callers can't mutate the cached entries
+            return [{**t, 'ports': list(t['ports'])} for t in cached[2]]
+
+        targets = self._parse_and_validate(ip_string)
+        self._parsed_cache = (ip_string, default_ports, [{**t, 'ports': list(t['ports'])} for t in targets])
+        return targets
+
+    def clear_cache(self) -> None:
+        """Drops the memoized result of the last parse."""
+        self._parsed_cache = None
+
+    def _parse_and_validate(self, ip_string: str) -> List[Dict[str, Any]]:
         targets = []
         processed_hosts = set()
         lines = [line.strip() for line in ip_string.splitlines() if line.strip()]
@@ -101,27 +133,27 @@ class TargetParser:
                     raise ValueError(f"The hostname '{host}' contains invalid characters.")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def extract_host(value: str) -> str:
         """Extracts the host from an input line that may include ports and/or IPv6 brackets."""
+        # Memoized and interned: the same lines are re-extracted on every edit
+        # of the target field and every status row refresh.
+        # The last alternative accepts anything, so there is always a match
         s = value.strip()
-        if s.startswith('['):
-            end = s.find(']')
-            if end != -1:
-                return s[1:end]
-        try:
-            ipaddress.ip_address(s)
-            return s
-        except ValueError:
-            pass
-        if ':' in s:
-            # Check if it's a hostname with a port
-            if '.' in s.split(':', 1)[0]:
-                return s.split(':', 1)[0].strip()
-            # It could be an unbracketed IPv6, so we can't just split.
-            # However, for the purpose of this app, we assume hostnames are FQDNs or simple names.
-            # A simple split is likely sufficient for the intended use case.
-            return s.split(':', 1)[0].strip()
-        return s
+        m = _HOST_RE.match(s)
+        bracketed, ipv6, host = m.group('bracketed', 'ipv6', 'host')
+        if bracketed is not None:
+            return sys.intern(bracketed)
+        if ipv6 is not None:
+            # Only IPv6-shaped lines pay for this check, never plain hostnames.
+            # ipaddress takes any %scope, so "fe80::1%eth0:80" stays whole,
+            # while "1:2:3" is not an address and splits like host:port.
+            try:
+                ipaddress.ip_address(s)
+                return sys.intern(s)
+            except ValueError:
+                host = s.split(':', 1)[0]
+        return sys.intern(host.strip())
 
     @staticmethod
     def format_host_for_url(host: str) -> str:
@@ -2,17 +2,27 @@
 Handles OS-specific routing table and gateway lookups.
 Primary method uses 'netifaces', with a fallback to system commands for robustness.
 """
+import ctypes
 import logging
 import platform
 import re
+import socket
 import subprocess
+import time
 from collections import namedtuple
+from functools import lru_cache
 from typing import Optional, List, Tuple
 import ipaddress
 
 import netifaces
 import psutil
 
+# Routing lookups are served from a short-lived snapshot so repeated gateway
+# discovery and interface scoring don't hit the kernel on every call.
+_ROUTE_CACHE_TTL = 30.0
+_if_stats_cache: Tuple[float, dict] = (0.0, {})
+_windows_gateways_cache: Tuple[float, List[Tuple[str, str, int]]] = (0.0, [])
+
 
 def _get_interface_name_for_gateway(gateway_ip: str) -> Optional[str]:
     """Finds the interface name associated with a given gateway IP."""
@@ -32,6 +42,17 @@ def _get_interface_name_for_gateway(gateway_ip: str) -> Optional[str]:
     return None
 
 
+def _get_cached_if_stats() -> dict:
+    """Returns psutil.net_if_stats(), refreshed at most once per cache TTL."""
+    global _if_stats_cache
+    stamp, stats = _if_stats_cache
+    now = time.monotonic()
+    if not stats or now - stamp > _ROUTE_CACHE_TTL:
+        stats = psutil.net_if_stats()
+        _if_stats_cache = (now, stats)
+    return stats
+
+
 def _score_interface(iface_name: str) -> int:
     """Scores an interface based on its likelihood of being the 'real' physical one."""
     name = iface_name.lower()
@@ -48,7 +69,7 @@ def _score_interface(iface_name: str) -> int:
             score += 20
     # Check if it's up
     try:
-        stats = psutil.net_if_stats()
+        stats = _get_cached_if_stats()
         # Create a dummy stats object for interfaces not returned by psutil.
         SNICStats = namedtuple('SNICStats', ['isup'])
         snicstats_default = SNICStats(isup=False)
@@ -61,6 +82,185 @@ def _score_interface(iface_name: str) -> int:
     return score
 
 
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_uint16),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_uint8 * 4),
+        ("sin_zero", ctypes.c_uint8 * 8),
+    ]
+
+
+class _SockaddrIn6(ctypes.Structure):
+    _fields_ = [
+        ("sin6_family", ctypes.c_uint16),
+        ("sin6_port", ctypes.c_uint16),
+        ("sin6_flowinfo", ctypes.c_uint32),
+        ("sin6_addr", ctypes.c_uint8 * 16),
+        ("sin6_scope_id", ctypes.c_uint32),
+    ]
+
+
+class _SockaddrInet(ctypes.Union):
+    _fields_ = [
+        ("Ipv4", _SockaddrIn),
+        ("Ipv6", _SockaddrIn6),
+        ("si_family", ctypes.c_uint16),
+    ]
+
+
+class _IpAddressPrefix(ctypes.Structure):
+    _fields_ = [
+        ("Prefix", _SockaddrInet),
+        ("PrefixLength", ctypes.c_uint8),
+    ]
+
+
+class _MibIpForwardRow2(ctypes.Structure):
+    _fields_ = [
+        ("InterfaceLuid", ctypes.c_uint64),
+        ("InterfaceIndex", ctypes.c_uint32),
+        ("DestinationPrefix", _IpAddressPrefix),
+        ("NextHop", _SockaddrInet),
+        ("SitePrefixLength", ctypes.c_uint8),
+        ("ValidLifetime", ctypes.c_uint32),
+        ("PreferredLifetime", ctypes.c_uint32),
+        ("Metric", ctypes.c_uint32),
+        ("Protocol", ctypes.c_int),
+        ("Loopback", ctypes.c_uint8),
+        ("AutoconfigureAddress", ctypes.c_uint8),
+        ("Publish", ctypes.c_uint8),
+        ("Immortal", ctypes.c_uint8),
+        ("Age", ctypes.c_uint32),
+        ("Origin", ctypes.c_int),
+    ]
+
+
+class _MibIpForwardTable2(ctypes.Structure):
+    _fields_ = [
+        ("NumEntries", ctypes.c_uint32),
+        ("Table", _MibIpForwardRow2 * 1),
+    ]
+
+
+class _MibIpInterfaceRow(ctypes.Structure):
+    _fields_ = [
+        ("Family", ctypes.c_uint16),
+        ("InterfaceLuid", ctypes.c_uint64),
+        ("InterfaceIndex", ctypes.c_uint32),
+        ("MaxReassemblySize", ctypes.c_uint32),
+        ("InterfaceIdentifier", ctypes.c_uint64),
+        ("MinRouterAdvertisementInterval", ctypes.c_uint32),
+        ("MaxRouterAdvertisementInterval", ctypes.c_uint32),
+        ("AdvertisingEnabled", ctypes.c_uint8),
+        ("ForwardingEnabled", ctypes.c_uint8),
+        ("WeakHostSend", ctypes.c_uint8),
+        ("WeakHostReceive", ctypes.c_uint8),
+        ("UseAutomaticMetric", ctypes.c_uint8),
+        ("UseNeighborUnreachabilityDetection", ctypes.c_uint8),
+        ("ManagedAddressConfigurationSupported", ctypes.c_uint8),
+        ("OtherStatefulConfigurationSupported", ctypes.c_uint8),
+        ("AdvertiseDefaultRoute", ctypes.c_uint8),
+        ("RouterDiscoveryBehavior", ctypes.c_int),
+        ("DadTransmits", ctypes.c_uint32),
+        ("BaseReachableTime", ctypes.c_uint32),
+        ("RetransmitTime", ctypes.c_uint32),
+        ("PathMtuDiscoveryTimeout", ctypes.c_uint32),
+        ("LinkLocalAddressBehavior", ctypes.c_int),
+        ("LinkLocalAddressTimeout", ctypes.c_uint32),
+        ("ZoneIndices", ctypes.c_uint32 * 16),
+        ("SitePrefixLength", ctypes.c_uint32),
+        ("Metric", ctypes.c_uint32),
+        ("NlMtu", ctypes.c_uint32),
+        ("Connected", ctypes.c_uint8),
+        ("SupportsWakeUpPatterns", ctypes.c_uint8),
+        ("SupportsNeighborDiscovery", ctypes.c_uint8),
+        ("SupportsRouterDiscovery", ctypes.c_uint8),
+        ("ReachableTime", ctypes.c_uint32),
+        ("TransmitOffload", ctypes.c_uint8),  # NL_INTERFACE_OFFLOAD_ROD bitfield byte
+        ("ReceiveOffload", ctypes.c_uint8),
+        ("DisableDefaultRoutes", ctypes.c_uint8),
+    ]
+
+
+@lru_cache(maxsize=1)
+def _load_iphlpapi() -> "ctypes.WinDLL":  # type: ignore[name-defined]
+    """Loads iphlpapi with its prototypes declared, so pointers keep their full width."""
+    iphlpapi = ctypes.WinDLL("iphlpapi")  # type: ignore[attr-defined]
+    table_pp = ctypes.POINTER(ctypes.POINTER(_MibIpForwardTable2))
+    row_p = ctypes.POINTER(_MibIpInterfaceRow)
+    for name, argtypes, restype in (
+        ("GetIpForwardTable2", [ctypes.c_uint16, table_pp], ctypes.c_ulong),
+        ("FreeMibTable", [ctypes.c_void_p], None),
+        ("ConvertInterfaceLuidToAlias",
+         [ctypes.POINTER(ctypes.c_uint64), ctypes.c_wchar_p, ctypes.c_size_t], ctypes.c_ulong),
+        ("InitializeIpInterfaceEntry", [row_p], None),
+        ("GetIpInterfaceEntry", [row_p], ctypes.c_ulong),
+    ):
+        func = getattr(iphlpapi, name)
+        func.argtypes = argtypes
+        func.restype = restype
+    return iphlpapi
+
+
+def _get_windows_interface_metric(iphlpapi, luid: int) -> int:
+    """Returns the IPv4 interface metric for a LUID, or 0 if it cannot be read."""
+    row = _MibIpInterfaceRow()
+    iphlpapi.InitializeIpInterfaceEntry(ctypes.byref(row))
+    row.Family = socket.AF_INET
+    row.InterfaceLuid = luid
+    if iphlpapi.GetIpInterfaceEntry(ctypes.byref(row)) != 0:
+        return 0
+    return row.Metric
+
+
+def _get_windows_default_gateways() -> List[Tuple[str, str, int]]:
+    """
+    Reads IPv4 default routes via iphlpapi's GetIpForwardTable2.
+    Returns (gateway_ip, interface_alias, metric) tuples, cached for the TTL.
+    The metric is route metric plus interface metric, as Windows ranks routes.
+    """
+    global _windows_gateways_cache
+    stamp, cached = _windows_gateways_cache
+    now = time.monotonic()
+    if cached and now - stamp <= _ROUTE_CACHE_TTL:
+        return cached
+
+    iphlpapi = _load_iphlpapi()
+    table_ptr = ctypes.POINTER(_MibIpForwardTable2)()
+    status = iphlpapi.GetIpForwardTable2(socket.AF_INET, ctypes.byref(table_ptr))
+    if status != 0:
+        raise OSError(status, "GetIpForwardTable2 failed")
+
+    gateways: List[Tuple[str, str, int]] = []
+    try:
+        count = table_ptr.contents.NumEntries
+        rows = ctypes.cast(
+            ctypes.addressof(table_ptr.contents.Table),
+            ctypes.POINTER(_MibIpForwardRow2 * count),
+        ).contents
+        alias = ctypes.create_unicode_buffer(257)
+        for row in rows:
+            if row.DestinationPrefix.PrefixLength != 0:
+                continue
+            gw_ip = socket.inet_ntoa(bytes(row.NextHop.Ipv4.sin_addr))
+            if gw_ip == "0.0.0.0":
+                continue  # On-link default route, no next hop
+            luid = ctypes.c_uint64(row.InterfaceLuid)
+            if iphlpapi.ConvertInterfaceLuidToAlias(ctypes.byref(luid), alias, len(alias)) == 0:
+                iface = alias.value
+            else:
+                iface = _get_interface_name_for_gateway(gw_ip) or ""
+            metric = row.Metric + _get_windows_interface_metric(iphlpapi, row.InterfaceLuid)
+            gateways.append((gw_ip, iface, metric))
+    finally:
+        iphlpapi.FreeMibTable(table_ptr)
+
+    gateways.sort(key=lambda gw: gw[2])
+    _windows_gateways_cache = (now, gateways)
+    return gateways
+
+
 def _get_gateway_from_system_command() -> Optional[str]:
     """
     Parses system routing tables to find the best default gateway.
@@ -70,15 +270,21 @@ def _get_gateway_from_system_command() -> Optional[str]:
     system = platform.system()
     try:
         if system == "Windows":
-            result = subprocess.run(["route", "print", "-4"], capture_output=True, text=True, check=True)
-            for line in result.stdout.splitlines():
-                if line.strip().startswith("0.0.0.0"):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        gw_ip = parts[2]
-                        iface = _get_interface_name_for_gateway(gw_ip)
-                        if iface:
-                            gateways.append((gw_ip, iface))
+            try:
+                # Effective metric (route + interface) breaks ties between equally
+                # scored interfaces; the list is already sorted by it and sorted() is stable.
+                gateways = [(gw_ip, iface) for gw_ip, iface, _ in _get_windows_default_gateways() if iface]
+            except (OSError, AttributeError) as e:
+                logging.warning(f"GetIpForwardTable2 lookup failed: {e}. Falling back to 'route print'.")
+                result = subprocess.run(["route", "print", "-4"], capture_output=True, text=True, check=True)
+                for line in result.stdout.splitlines():
+                    if line.strip().startswith("0.0.0.0"):
+                        parts = line.split()
+                        if len(parts) >= 3:
+                            gw_ip = parts[2]
+                            iface = _get_interface_name_for_gateway(gw_ip)
+                            if iface:
+                                gateways.append((gw_ip, iface))
         elif system in ["Linux", "Darwin"]:
             result = subprocess.run(["ip", "route"], capture_output=True, text=True, check=True)
             for line in result.stdout.splitlines():
@@ -2,101 +2,148 @@
 UI animations for the TechRoute status indicator.
 """
 from __future__ import annotations
+import functools
+import itertools
+import sys
 import tkinter as tk
+from enum import Enum, auto
 from tkinter import ttk
+from typing import Optional
+
+# Only the unique frames are stored; the tick bounces across them
+# (0-1-2-3-4-3-2-1-0), so one cycle is 2 * len - 1 frames.
+_PING_UNIQUE = tuple(sys.intern(frame) for frame in (
+    "💻 • . . . . 📠", "💻 . • . . . 📠", "💻 . . • . . 📠",
+    "💻 . . . • . 📠", "💻 . . . . • 📠",
+))
+_PING_PEAK = len(_PING_UNIQUE) - 1
+_PING_LEN = 2 * _PING_PEAK + 1
+_NEUTRAL_FRAME = sys.intern("💻 . . . . . 📠")
+
+
+@functools.lru_cache(maxsize=8)
+def _compute_frame_delay(duration_ms: int) -> tuple[int, int]:
+    """Returns (frame_delay, rest_time) in ms for a ping cycle of duration_ms."""
+    animation_duration = max(500, duration_ms - 500)
+    return animation_duration // _PING_LEN, max(100, duration_ms - animation_duration)
+
+
+class _AnimState(Enum):
+    """Which animation the indicator tick is currently driving."""
+    IDLE = auto()
+    BLINK = auto()
+    PING = auto()
+
 
 class Animator:
     """Manages animations for the status indicator widget."""
 
+    _BLINK_ON = sys.intern("💻           📠")
+    _BLINK_OFF = sys.intern("💻 ? ? ? ? ? 📠")
+    _BLINK_FRAMES = (_BLINK_OFF, _BLINK_ON)
+    _BLINK_DELAY_MS = 500
+
     def __init__(self, root: tk.Tk, status_indicator: ttk.Label):
         self.root = root
         self.status_indicator = status_indicator
+        # Talk to Tcl directly; the frames are fixed strings, so the kwargs
+        # handling in Misc.configure is pure overhead on every frame.
+        self._widget_path = str(status_indicator)
+        self._tk_call = status_indicator.tk.call
         self.animation_job = None
-        self._is_blinking = False
-        self._is_pinging = False
+        self._anim_state = _AnimState.IDLE
+        self._anim_index = 0
+        self._anim_delay = 0
+        self._ping_frame_delay = 0
+        self._ping_wait_time = 0
+        self._blink_iter = itertools.cycle(self._BLINK_FRAMES)
+        self._last_text = None
+        # Bound once so re-arming the tick doesn't allocate a new method object
+        self._tick_cb = self._tick
+        # Flag teardown once instead of catching TclError on every tick
+        self._dead = False
+        status_indicator.bind('<Destroy>', self._on_indicator_destroyed, add='+')
+
+    def _on_indicator_destroyed(self, _event=None):
+        """Marks the indicator as gone so pending ticks stop quietly."""
+        self._dead = True
+        self._anim_state = _AnimState.IDLE
+
+    def _set_text(self, text: str):
+        """Updates the indicator text, skipping the Tk call if nothing changed."""
+        # Frames are module/class constants, so the identity check usually hits.
+        if text is self._last_text or text == self._last_text:
+            return
+        self._tk_call(self._widget_path, 'configure', '-text', text)
+        self._last_text = text
 
     def start_blinking_animation(self):
         """Starts a blinking animation with question marks."""
-        if self._is_blinking:
+        if self._anim_state is _AnimState.BLINK:
             return
         self.stop_animation()
-        self._is_blinking = True
-        self._blink()
+        self._anim_state = _AnimState.BLINK
+        self._anim_delay = self._BLINK_DELAY_MS
+        # Restart the cycle so the first tick shows the question marks
+        self._blink_iter = itertools.cycle(self._BLINK_FRAMES)
+        self._start_ticking()
 
-    def _blink(self):
-        """Helper function for the blinking animation."""
-        if not self._is_blinking:
+    def run_ping_animation(self, duration_ms: int):
+        """Starts a continuous ping animation loop scaled by the polling rate."""
+        if self._anim_state is _AnimState.PING:
             return
+        self.stop_animation()
+        self._anim_state = _AnimState.PING
+        self._ping_frame_delay, self._ping_wait_time = _compute_frame_delay(duration_ms)
+        self._anim_index = 0
+        self._start_ticking()
+
+    def _start_ticking(self):
+        """Runs the first tick, the only place that guards against Tk errors."""
         try:
-            current_text = self.status_indicator.cget("text")
-            new_text = "💻           📠" if "?" in current_text else "💻 ? ? ? ? ? 📠"
-            self.status_indicator.config(text=new_text)
-            self.animation_job = self.root.after(500, self._blink)
+            self._tick_cb()
         except tk.TclError:
+            self._anim_state = _AnimState.IDLE
             self.animation_job = None
-            self._is_blinking = False
 
-    def stop_animation(self):
-        """Stops any running animation."""
+    def _tick(self):
+        """Advances the active animation by one frame and re-arms itself."""
+        self.animation_job = None
+        state = self._anim_state
+        if self._dead or state is _AnimState.IDLE:
+            return
+        if state is _AnimState.BLINK:
+            text = next(self._blink_iter)
+        else:
+            index = self._anim_index
+            if index < _PING_LEN:
+                text = _PING_UNIQUE[_PING_PEAK - abs(index - _PING_PEAK)]
+                self._anim_delay = self._ping_frame_delay
+                self._anim_index = index + 1
+            else:
+                # Cycle finished; rest on the neutral frame until the next one
+                text = _NEUTRAL_FRAME
+                self._anim_delay = self._ping_wait_time
+                self._anim_index = 0
+        self._set_text(text)
+        self.animation_job = self.root.after(self._anim_delay, self._tick_cb)
+
+    def stop_animation(self, final_text: Optional[str] = None):
+        """Stops any running animation and shows final_text (neutral by default)."""
+        if final_text is None:
+            if self.animation_job is None and self._anim_state is _AnimState.IDLE:
+                return
+            # Set a neutral state when stopping, not a specific animation frame
+            final_text = _NEUTRAL_FRAME
         if self.animation_job:
             self.root.after_cancel(self.animation_job)
             self.animation_job = None
-        self._is_blinking = False
-        self._is_pinging = False
+        self._anim_state = _AnimState.IDLE
         try:
-            # Set a neutral state when stopping, not a specific animation frame
-            self.status_indicator.config(text="💻 . . . . . 📠")
+            self._set_text(final_text)
         except tk.TclError:
             pass
 
     def reset_status_indicator(self):
         """Resets the status indicator to its initial state."""
-        self.stop_animation()
-        try:
-            self.status_indicator.config(text="💻 ? ? ? ? ? 📠")
-        except tk.TclError:
-            pass
-
-    def run_ping_animation(self, duration_ms: int):
-        """Starts a continuous ping animation loop scaled by the polling rate."""
-        if self._is_pinging:
-            return
-        
-        self.stop_animation()
-        self._is_pinging = True
-        self._ping_loop(duration_ms)
-
-    def _ping_loop(self, duration_ms: int):
-        """The core loop for the ping animation."""
-        if not self._is_pinging:
-            self.reset_status_indicator()
-            return
-
-        frames = [
-            "💻 • . . . . 📠", "💻 . • . . . 📠", "💻 . . • . . 📠",
-            "💻 . . . • . 📠", "💻 . . . . • 📠", "💻 . . . • . 📠",
-            "💻 . . • . . 📠", "💻 . • . . . 📠", "💻 • . . . . 📠",
-        ]
-        
-        animation_duration = max(500, duration_ms - 500)
-        frame_delay = animation_duration // len(frames)
-        
-        def update_frame(frame_index: int):
-            if not self._is_pinging:
-                self.reset_status_indicator()
-                return
-
-            try:
-                if frame_index < len(frames):
-                    self.status_indicator.config(text=frames[frame_index])
-                    self.animation_job = self.root.after(frame_delay, update_frame, frame_index + 1)
-                else:
-                    # Animation cycle finished, prepare for the next one
-                    self.status_indicator.config(text="💻 . . . . . 📠")
-                    wait_time = max(100, duration_ms - animation_duration)
-                    self.animation_job = self.root.after(wait_time, self._ping_loop, duration_ms)
-            except tk.TclError:
-                self._is_pinging = False
-                self.animation_job = None
-
-        update_frame(0)
+        self.stop_animation(final_text=self._BLINK_OFF)
@@ -5,11 +5,17 @@ Defines the AppUI class, composed from mixins, responsible for building
 and managing all Tkinter widgets for the main application window.
 """
 from __future__ import annotations
+import collections
+import logging
+import platform
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional, TYPE_CHECKING, List
+from typing import AbstractSet, Deque, Dict, Any, Optional, TYPE_CHECKING, List, Tuple
 
 from .widgets import NetworkInfoPanel, TargetInputPanel, StatusBar
+from .widgets.utils import changed_config_keys, split_mnemonic
 from .animator import Animator
 from .dialog_manager import DialogManager
 from .menu_manager import MenuManager
@@ -23,6 +29,15 @@ if TYPE_CHECKING:
     from typing import Callable
     from ..controller import TechRouteController
 
+_LOCALHOST = sys.intern('127.0.0.1')
+_NETWORK_POLL_MIN_MS = 1000
+_NETWORK_POLL_MAX_MS = 8000
+_STATUS_FLUSH_MS = 50
+# Linux window managers report a tighter requested width; shrink_to_fit pads it
+_IS_LINUX = platform.system() == "Linux"
+# Trailing delay that folds <Configure> storms from row churn and window drags into one layout pass
+_LAYOUT_DELAY_MS = 32
+
 
 class AppUI:
     """Manages the user interface of the TechRoute application."""
@@ -36,6 +51,42 @@ class AppUI:
         self._ = translator
         self.localization_manager = localization_manager
         self._config = {} # Will be populated by controller state later
+        # Latest pending status per target, applied together in one flush
+        self._pending_updates: Dict[str, StatusUpdatePayload] = {}
+        self._flush_job: Optional[str] = None
+        # A full target list waiting for the same flush; it supersedes earlier updates
+        self._pending_bulk: Optional[List[Dict[str, Any]]] = None
+        # Controller callbacks raised on worker threads wait here for the Tk thread
+        self._ui_queue: Deque[Tuple[Callable[..., None], tuple]] = collections.deque()
+        self._ui_thread_id = threading.get_ident()
+        # Last network info handed to the panel; identical refreshes are dropped
+        self._last_network_info: Dict[str, Any] = {}
+        # Last controller state applied to the widgets
+        self._applied_state: Optional[AppState] = None
+        # Mirrors the Launch Web UIs button state (it is created disabled)
+        self._launch_all_enabled = False
+        # Geometry cached from <Configure> so layout checks needn't force update_idletasks
+        self._cached_req: Optional[Tuple[int, int]] = None
+        self._canvas_height = 1
+        self._scrollbar_shown = False  # No scrollbar until rows first overflow
+        # One pending pass applies the canvas width, scrollregion, scrollbar and visible rows
+        self._layout_job: Optional[str] = None
+        self._canvas_width = 1
+        self._applied_canvas_width = 0
+        self._last_scrollregion: Optional[Tuple[int, int, int, int]] = None
+        self._shrink_pending = False
+        # Hosts currently in the target entry, rebuilt once per edit burst
+        self._known_hosts: set[str] = set()
+        self._known_hosts_job: Optional[str] = None
+        # Network info poll: fast after a change, backing off while nothing happens
+        self._network_poll_ms = _NETWORK_POLL_MIN_MS
+        self._network_poll_job: Optional[str] = None
+        self._browser_name: Optional[str] = None
+        # Alt-key mnemonics, dispatched from a single <Alt-KeyPress> binding
+        self._mnemonics: Dict[str, Any] = {}
+        # Translatable text owned by AppUI, updated in place on a language switch
+        self._tr_vars: Dict[str, tk.StringVar] = {}
+        self._tr_buttons: List[Tuple[ttk.Button, str]] = []
 
         self._create_widgets()
         self.animator = Animator(self.root, self.status_indicator)
@@ -44,6 +95,7 @@ class AppUI:
         self.status_view_manager = StatusViewManager(self.root, self.status_frame, self.actions, self.dialog_manager, self, self._)
 
         self.menu_manager.setup()
+        self.menu_bar = self.menu_manager.menu_bar
         self._setup_ui_base()
         
         self._setup_ui_controller_dependent()
@@ -51,7 +103,6 @@ class AppUI:
         self.actions.register_network_info_callback(self.on_network_info_update)
 
         self.status_view_manager.setup_status_display([])
-        self.root.update_idletasks()
         self.shrink_to_fit()
         self._periodic_network_update()
 
@@ -67,7 +118,8 @@ class AppUI:
         self.target_input_panel = TargetInputPanel(self.main_frame, self._)
         self.status_container = ttk.LabelFrame(self.main_frame, text=self._("Status"))
         self.status_canvas = tk.Canvas(self.status_container, borderwidth=0, highlightthickness=0)
-        self.status_scrollbar = ttk.Scrollbar(self.status_container, orient="vertical", command=self.status_canvas.yview)
+        # Created the first time rows overflow; most sessions never scroll
+        self.status_scrollbar: Optional[ttk.Scrollbar] = None
         self.status_frame = ttk.Frame(self.status_container)
         
         self.ip_entry = self.target_input_panel.ip_entry
@@ -77,34 +129,40 @@ class AppUI:
         self.add_localhost_button = self.target_input_panel.add_localhost_button
         self.add_gateway_button = self.target_input_panel.add_gateway_button
         self.clear_field_button = self.target_input_panel.clear_field_button
-        
-        self.menu_bar = tk.Menu(self.root)
-        self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.settings_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.theme_menu = tk.Menu(self.settings_menu, tearoff=0)
-        self.language_menu = tk.Menu(self.settings_menu, tearoff=0)
-        self.tcp_port_readability_menu = tk.Menu(self.settings_menu, tearoff=0)
-        self.theme_var = tk.StringVar()
-        self.language_var = tk.StringVar()
-        self.tcp_port_readability_var = tk.StringVar()
-        
-        self.about_button = ttk.Button(self.help_menu)
-        self.github_button = ttk.Button(self.help_menu)
-        self.settings_button = ttk.Button(self.settings_menu)
-        self.exit_button = ttk.Button(self.file_menu)
 
     # ------------------- Callback Handlers from Controller -------------------
 
+    def _call_on_ui_thread(self, fn: Callable[..., None], *args: Any):
+        """Runs fn on the Tk thread: right away if already there, else at the next drain."""
+        if threading.get_ident() == self._ui_thread_id:
+            # Flush anything queued by workers first so callbacks keep their order
+            self.drain_ui_queue()
+            fn(*args)
+        else:
+            self._ui_queue.append((fn, args))
+
+    def drain_ui_queue(self):
+        """Runs the callbacks worker threads have queued for the Tk thread."""
+        ui_queue = self._ui_queue
+        while ui_queue:
+            fn, args = ui_queue.popleft()
+            fn(*args)
+
     def on_state_change(self, new_state: AppState):
-        """Reacts to application state changes from the controller."""
+        """Reacts to application state changes from the controller (any thread)."""
+        self._call_on_ui_thread(self._apply_state_change, new_state)
+
+    def _apply_state_change(self, new_state: AppState):
+        if new_state == self._applied_state:
+            return  # Repeated notification; the widgets already reflect it
+        self._applied_state = new_state
         self.target_input_panel.set_state("normal" if new_state == AppState.IDLE else "disabled")
 
         if new_state == AppState.IDLE:
             self.start_stop_button.config(text=self._("Start Pinging"))
             self.update_status_bar(self._("Pinging stopped."))
             self.animator.reset_status_indicator()
-            self.status_view_manager.setup_status_display(self.actions.get_all_targets_with_status())
+            self.on_bulk_status_update(self.actions.get_all_targets_with_status())
         elif new_state == AppState.CHECKING:
             self.start_stop_button.config(text=self._("Stop Pinging"))
             self.update_status_bar(self._("Checking targets..."))
@@ -118,28 +176,58 @@ class AppUI:
 
     def on_status_update(self, updates: List[StatusUpdatePayload]):
         """Handles status updates from the controller for multiple targets."""
+        pending = self._pending_updates
         for target_info in updates:
-            self.status_view_manager.update_target_row(target_info)
-        
-        if any(s.get('web_port_open') for s in self.actions.get_all_targets_with_status()):
-            self.launch_all_button.config(state=tk.NORMAL)
-        else:
-            self.launch_all_button.config(state=tk.DISABLED)
+            pending[target_info.original_string] = target_info
+        self._schedule_status_flush()
+
+    def _schedule_status_flush(self):
+        if self._flush_job is None:
+            # A short window lets updates from consecutive controller ticks coalesce
+            self._flush_job = self.root.after(_STATUS_FLUSH_MS, self._flush_status_updates)
+
+    def _flush_status_updates(self):
+        """Rebuilds from a pending bulk list if any, then applies the latest update per target."""
+        self._flush_job = None
+        bulk, self._pending_bulk = self._pending_bulk, None
+        if bulk is not None:
+            self.status_view_manager.setup_status_display(bulk)
+        pending, self._pending_updates = self._pending_updates, {}
+        update_row = self.status_view_manager.update_target_row
+        for target_info in pending.values():
+            update_row(target_info)
+
+        self._sync_launch_all()
+
+    def _sync_launch_all(self):
+        """Enables Launch Web UIs while any target has a web port open."""
+        # The view keeps a running count, so no scan over every target here
+        self._set_launch_all_enabled(self.status_view_manager.web_open_count > 0)
+
+    def _set_launch_all_enabled(self, enabled: bool):
+        """Enables or disables Launch Web UIs, skipping the call if it wouldn't change."""
+        if enabled == self._launch_all_enabled:
+            return
+        self._launch_all_enabled = enabled
+        self.launch_all_button.config(state=tk.NORMAL if enabled else tk.DISABLED)
 
     def on_initial_statuses_loaded(self, statuses: List[Dict[str, Any]]):
-        """Receives the initial list of targets to display."""
-        self.status_view_manager.setup_status_display(statuses)
+        """Receives the initial list of targets to display (any thread)."""
+        self._call_on_ui_thread(self.on_bulk_status_update, statuses)
 
     def on_bulk_status_update(self, statuses: List[Dict[str, Any]]):
         """Handles a bulk update of all statuses, typically after a check."""
-        self.status_view_manager.setup_status_display(statuses)
-        if any(s.get('web_port_open') for s in statuses):
-            self.launch_all_button.config(state=tk.NORMAL)
-        else:
-            self.launch_all_button.config(state=tk.DISABLED)
+        # Updates queued before the new list belong to the old one; the last
+        # list wins and the display is rebuilt at most once per flush
+        self._pending_bulk = statuses
+        self._pending_updates.clear()
+        self._schedule_status_flush()
 
     def on_network_info_update(self, info: NetworkInfoPayload):
         """Handles network information updates."""
+        if info == self._last_network_info:
+            return
+        self._last_network_info = dict(info)
         self.network_info_panel.update_info(info)
 
     # ------------------- UI Event Handlers -------------------
@@ -151,12 +239,24 @@ class AppUI:
             ip_string = self.target_input_panel.get_text()
             
             if self.actions.get_state() == AppState.IDLE and not ip_string:
-                messagebox.showerror(self._("Input Required"), self._("Please enter at least one IP address or hostname."))
+                self.show_error(self._("Input Required"), self._("Please enter at least one IP address or hostname."))
                 return
 
             self.actions.toggle_ping_process(ip_string, polling_rate_ms)
         except ValueError as e:
-            messagebox.showerror(self._("Invalid Target"), str(e))
+            self.show_error(self._("Invalid Target"), str(e))
+
+    def show_error(self, title: str, message: str):
+        """Reports an input error without blocking the event loop.
+
+        The message goes to the status bar for a few seconds; a modal dialog
+        is only used when 'strict_dialogs' is enabled in the config.
+        """
+        logging.warning("%s: %s", title, message)
+        if self._config.get('strict_dialogs'):
+            messagebox.showerror(title, message)
+            return
+        self.root.after_idle(self.status_bar.show_error, f"{title}: {message}")
 
     def _update_ping_process(self):
         """Stops the current process and starts a new one."""
@@ -175,8 +275,10 @@ class AppUI:
         if self.actions.get_state() != AppState.IDLE:
             self.stop_ping_process()
             
+        self._pending_bulk = None
+        self._pending_updates.clear()
         self.status_view_manager.setup_status_display([])
-        self.launch_all_button.config(state=tk.DISABLED)
+        self._set_launch_all_enabled(False)
         self.update_status_bar(self._("Statuses cleared."))
         self.animator.reset_status_indicator()
 
@@ -214,24 +316,36 @@ class AppUI:
     # ------------------- Boilerplate and Helpers -------------------
 
     def _create_button(self, parent, label, **kwargs):
-        translated_label = self._(label)
-        underline = translated_label.find('&')
-        mnemonic = None
+        kwargs['text'], underline, mnemonic = split_mnemonic(self._(label))
         if underline != -1:
-            kwargs['text'] = translated_label.replace('&', '', 1)
             kwargs['underline'] = underline
-            mnemonic = translated_label[underline + 1].lower()
-        else:
-            kwargs['text'] = translated_label
         
         button = ttk.Button(parent, **kwargs)
+        self._tr_buttons.append((button, label))
         return button, mnemonic
 
+    def _tr_var(self, key: str) -> tk.StringVar:
+        """Returns the shared StringVar showing the translation of key."""
+        var = self._tr_vars.get(key)
+        if var is None:
+            var = self._tr_vars[key] = tk.StringVar(self.root, value=self._(key))
+        return var
+
     def _bind_mnemonic(self, widget, mnemonic):
         if mnemonic:
-            self.root.bind(f'<Alt-{mnemonic}>', lambda e, w=widget: w.invoke())
+            self._mnemonics[mnemonic] = widget
+
+    def _on_alt_key(self, event):
+        # Unmapped keys fall through to Tk's default Alt handling (menu traversal).
+        # Mnemonics are stored lower-case, so Alt+Shift+key works too.
+        widget = self._mnemonics.get(event.keysym.lower())
+        if widget is not None:
+            widget.invoke()
 
     def _setup_ui_base(self):
+        self._mnemonics.update(self.target_input_panel.mnemonics)
+        self.root.bind('<Alt-KeyPress>', self._on_alt_key)
+        self.root.bind('<Map>', self._on_root_map, add='+')
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self.main_frame.columnconfigure(0, weight=1)
@@ -244,18 +358,16 @@ class AppUI:
         self.status_container.rowconfigure(0, weight=1)
         self.status_container.columnconfigure(0, weight=1)
         self.status_canvas.grid(row=0, column=0, sticky="nsew")
-        self.status_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.status_canvas.config(yscrollcommand=self.status_scrollbar.set)
+        self.status_canvas.config(yscrollcommand=self._on_status_yscroll)
         self.status_frame_window = self.status_canvas.create_window((0, 0), window=self.status_frame, anchor="nw")
-        self.status_scrollbar.grid_remove()
-        self.status_frame.bind("<Configure>", self._on_status_frame_configure)
         self.status_canvas.bind("<Configure>", self._on_canvas_configure)
+        self.main_frame.bind("<Configure>", self._invalidate_req_cache)
 
     def _setup_ui_controller_dependent(self):
         left_controls_frame = ttk.Frame(self.controls_frame)
         left_controls_frame.grid(row=0, column=0, sticky="w")
         
-        ttk.Label(left_controls_frame, text=self._("Polling Rate (ms):")).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(left_controls_frame, textvariable=self._tr_var("Polling Rate (ms):")).pack(side=tk.LEFT, padx=(0, 5))
         self.polling_rate_entry = ttk.Entry(left_controls_frame, width=5)
         self.polling_rate_entry.pack(side=tk.LEFT, padx=(0, 15))
         self.polling_rate_entry.insert(0, str(self.actions.get_polling_rate_ms()))
@@ -279,21 +391,52 @@ class AppUI:
         self.network_info_panel.setup_local_services(self.config)
         
         tip = self.target_input_panel
-        tip.add_localhost_button.config(command=self._add_localhost_to_input)
-        tip.add_gateway_button.config(command=self._add_gateway_to_input)
-        tip.clear_field_button.config(command=self._clear_input_field)
-        tip.start_stop_button.config(command=self.toggle_ping_process)
-        tip.launch_all_button.config(command=self.launch_all_web_uis)
-        tip.clear_statuses_button.config(command=self._clear_statuses)
+        # Bound methods straight from a table: no forwarding lambdas, and the
+        # Alt mnemonics reach these through the single <Alt-KeyPress> handler
+        for button, command in (
+            (tip.add_localhost_button, self._add_localhost_to_input),
+            (tip.add_gateway_button, self._add_gateway_to_input),
+            (tip.clear_field_button, self._clear_input_field),
+            (tip.start_stop_button, self.toggle_ping_process),
+            (tip.launch_all_button, self.launch_all_web_uis),
+            (tip.clear_statuses_button, self._clear_statuses),
+        ):
+            button.configure(command=command)
+        tip.ip_entry.bind('<<Modified>>', self._on_ip_entry_modified)
 
     def _periodic_network_update(self):
+        self._network_poll_job = None
+        if self.root.state() in ('iconic', 'withdrawn'):
+            # Nothing to show while minimized, so stop polling; <Map> restarts it
+            # and the controller hands over only the newest queued snapshot
+            return
         if self.actions:
-            self.actions.process_network_updates()
-            self.target_input_panel.update_browser_name(self.actions.get_browser_name())
-        self.root.after(1000, self._periodic_network_update)
+            changed = self.actions.process_network_updates()
+            browser_name = self.actions.get_browser_name()
+            if browser_name != self._browser_name:
+                self._browser_name = browser_name
+                self.target_input_panel.update_browser_name(browser_name)
+                changed = True
+            # Network info only arrives about once a minute, so back off while quiet
+            if changed:
+                self._network_poll_ms = _NETWORK_POLL_MIN_MS
+            else:
+                self._network_poll_ms = min(_NETWORK_POLL_MAX_MS, self._network_poll_ms * 2)
+        self._network_poll_job = self.root.after(self._network_poll_ms, self._periodic_network_update)
+
+    def _on_root_map(self, event: tk.Event):
+        # <Map> on the root also fires for every child widget shown
+        if event.widget is not self.root:
+            return
+        self._network_poll_ms = _NETWORK_POLL_MIN_MS
+        if self._network_poll_job:
+            self.root.after_cancel(self._network_poll_job)
+        self._network_poll_job = self.root.after_idle(self._periodic_network_update)
+        # The local-services probe may have backed off while hidden; refresh it now
+        self.network_info_panel.wake_local_services_check(self._config)
 
     def _add_localhost_to_input(self):
-        self._append_unique_line_to_ip_entry("127.0.0.1")
+        self._append_unique_line_to_ip_entry(_LOCALHOST)
 
     def _add_gateway_to_input(self):
         gateway_ip = self.actions.get_gateway_ip()
@@ -303,22 +446,45 @@ class AppUI:
             self.update_status_bar(self._("Gateway not detected."))
 
     def _clear_input_field(self):
-        if self.target_input_panel.ip_entry.cget('state') != tk.NORMAL:
+        if not self.target_input_panel.editable:
             return
         self.target_input_panel.clear()
+        self._known_hosts.clear()
 
-    def _append_unique_line_to_ip_entry(self, value: str):
-        if self.target_input_panel.ip_entry.cget('state') != tk.NORMAL:
+    def _normalize_host(self, line: str) -> str:
+        # extract_host interns its results, so known-host lookups hit by identity
+        host = self.actions.extract_host(line)
+        return _LOCALHOST if host == 'localhost' else host
+
+    def _on_ip_entry_modified(self, event: Optional[tk.Event] = None):
+        ip_entry = self.target_input_panel.ip_entry
+        # Resetting the flag fires <<Modified>> again; ignore that echo
+        if not ip_entry.edit_modified():
             return
-        
+        ip_entry.edit_modified(False)
+        if self._known_hosts_job is None:
+            self._known_hosts_job = self.root.after_idle(self._rebuild_known_hosts)
+
+    def _rebuild_known_hosts(self):
+        self._known_hosts_job = None
         content = self.target_input_panel.get_text()
-        lines = [l.strip() for l in content.splitlines() if l.strip()]
-        
-        # This is a temporary hack until the parser is available via an action
-        # if any(self.actions.parser.extract_host(line) == value for line in lines):
-        #     return
-        
+        self._known_hosts = {self._normalize_host(l) for l in content.splitlines() if l.strip()}
+
+    def _append_unique_line_to_ip_entry(self, value: str):
+        if not self.target_input_panel.editable:
+            return
+
+        host = self._normalize_host(value)
+        if host in self._known_hosts:
+            return
+        ip_entry = self.target_input_panel.ip_entry
+        settled = not ip_entry.edit_modified()
         self.target_input_panel.append_line(value)
+        self._known_hosts.add(host)
+        if settled:
+            # The set already has the new host; clearing the flag makes the queued
+            # <<Modified>> a no-op instead of a rescan of the whole entry
+            ip_entry.edit_modified(False)
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -328,37 +494,122 @@ class AppUI:
     @config.setter
     def config(self, value: Dict[str, Any]):
         """Sets the application configuration."""
+        changed = changed_config_keys(self._config, value)
         self._config = value
-        self.refresh_ui()
+        self.refresh_ui(changed)
 
-    def refresh_ui(self):
-        self.network_info_panel.refresh_for_settings_change(self._config)
-        self.status_view_manager.refresh_status_rows_for_settings()
+    def refresh_ui(self, changed: Optional[AbstractSet[str]] = None):
+        """Refreshes the parts of the UI that depend on the changed config keys.
 
-    def _on_canvas_configure(self, event: tk.Event):
-        self.status_canvas.itemconfig(self.status_frame_window, width=event.width)
+        Without changed, the controller's current config is diffed against
+        the one last applied here.
+        """
+        if changed is None:
+            new_config = self.actions.get_config()
+            changed = changed_config_keys(self._config, new_config)
+            self._config = new_config
+        if not changed:
+            return
+        self.network_info_panel.refresh_for_settings_change(self._config, changed)
+        self.status_view_manager.refresh_status_rows_for_settings(changed)
+
+    def _invalidate_req_cache(self, event: Optional[tk.Event] = None):
+        self._cached_req = None
+
+    def _settle_geometry(self):
+        """Runs pending geometry work so winfo_req* values are current.
+
+        This is the only place the UI flushes Tk's queue. It deliberately uses
+        update_idletasks() and never update(): a full update() would dispatch
+        user and timer events from inside a layout query and re-enter handlers.
+        """
+        if threading.get_ident() != self._ui_thread_id:
+            raise RuntimeError("Tk geometry can only be settled on the UI thread")
+        self.root.update_idletasks()
 
-    def _on_status_frame_configure(self, event: tk.Event):
-        self.status_canvas.configure(scrollregion=self.status_canvas.bbox("all"))
-        self.root.after_idle(self._toggle_status_scrollbar)
+    def _get_requested_size(self) -> Tuple[int, int]:
+        """Returns the root's requested size, settling geometry only when stale."""
+        if self._cached_req is None:
+            self._settle_geometry()
+            self._cached_req = (self.root.winfo_reqwidth(), self.root.winfo_reqheight())
+        return self._cached_req
+
+    def _on_canvas_configure(self, event: tk.Event):
+        if event.width == self._canvas_width and event.height == self._canvas_height:
+            return  # Moves and repeated events for the same size
+        # A window drag fires this per pixel; the layout pass reads the latest size
+        self._canvas_width = event.width
+        self._canvas_height = event.height
+        self.schedule_status_layout()
+
+    def _on_status_yscroll(self, first: str, last: str):
+        # Scrolling moves the viewport; rebind pooled rows to what is now visible
+        if self.status_scrollbar is not None:
+            self.status_scrollbar.set(first, last)
+        self.status_view_manager.refresh_visible()
+
+    def schedule_status_layout(self):
+        """Arms a single trailing layout pass for the status canvas.
+
+        The pass reads the current sizes when it runs, so a pending one covers
+        any later events too and is never cancelled and re-armed.
+        """
+        if self._layout_job is None:
+            self._layout_job = self.root.after(_LAYOUT_DELAY_MS, self._do_layout)
+
+    def _do_layout(self):
+        self._layout_job = None
+        width = self._canvas_width
+        if width != self._applied_canvas_width:
+            self._applied_canvas_width = width
+            self.status_canvas.itemconfig(self.status_frame_window, width=width)
+        # Rows sit at fixed offsets, so the extent is known without bbox walking items
+        region = (0, 0, width, self.status_view_manager.content_height)
+        if region != self._last_scrollregion:
+            self._last_scrollregion = region
+            self.status_canvas.configure(scrollregion=region)
+        self._toggle_status_scrollbar()
+        self.status_view_manager.refresh_visible()
 
     def update_status_bar(self, message: str):
         self.status_bar.update_status(message)
 
     def _toggle_status_scrollbar(self):
-        self.status_frame.update_idletasks()
-        frame_height = self.status_frame.winfo_reqheight()
-        canvas_height = self.status_canvas.winfo_height()
-        self.status_scrollbar.grid() if frame_height > canvas_height else self.status_scrollbar.grid_remove()
+        # Pure arithmetic on cached heights; Tk is only touched when visibility flips
+        need_bar = self.status_view_manager.content_height > self._canvas_height
+        if need_bar == self._scrollbar_shown:
+            return
+        self._scrollbar_shown = need_bar
+        scrollbar = self.status_scrollbar
+        if scrollbar is None:
+            scrollbar = self.status_scrollbar = ttk.Scrollbar(
+                self.status_container, orient="vertical", command=self.status_canvas.yview
+            )
+            scrollbar.grid(row=0, column=1, sticky="ns")
+            # Catch up on the view the canvas reported before the bar existed
+            scrollbar.set(*self.status_canvas.yview())
+        else:
+            scrollbar.grid() if need_bar else scrollbar.grid_remove()
 
     def shrink_to_fit(self):
-        import platform
-        self.root.update_idletasks()
-        width = self.root.winfo_reqwidth()
-        height = self.root.winfo_reqheight()
-        if platform.system() == "Linux":
+        """Sizes the window to its content on the next idle pass.
+
+        Calls made before then collapse into one geometry settle.
+        """
+        if self._shrink_pending:
+            return
+        self._shrink_pending = True
+        self.root.after_idle(self._do_shrink_to_fit)
+
+    def _do_shrink_to_fit(self):
+        self._shrink_pending = False
+        width, height = self._get_requested_size()
+        if _IS_LINUX:
             width = int(width * 1.25)
             # height = int(height * 1.15)
+        # winfo_width/height read Tk's cached geometry; no layout pass is forced
+        if (width, height) == (self.root.winfo_width(), self.root.winfo_height()):
+            return
         self.root.geometry(f"{width}x{height}")
 
     def handle_settings_change(self, old_config, new_config):
@@ -369,11 +620,34 @@ class AppUI:
             self.retranslate_ui()
 
     def retranslate_ui(self):
-        """Retranslates the entire UI."""
+        """Retranslates the entire UI in place, without rebuilding any widgets."""
         _ = self.localization_manager.translator
+        self._ = _
         self.root.title(_("TechRoute - Machine Service Checker"))
-        # self.ui.retranslate_ui(_) 
+        for key, var in self._tr_vars.items():
+            var.set(_(key))
+        self.status_container.config(text=_("Status"))
+
+        # Mnemonic letters can move with the language, so re-register them
+        self._mnemonics.clear()
+        for button, label in self._tr_buttons:
+            text, underline, mnemonic = split_mnemonic(_(label))
+            button.config(text=text, underline=underline)
+            self._bind_mnemonic(button, mnemonic)
+
+        self.status_bar.retranslate_ui(_)
+        self.network_info_panel.retranslate_ui(_)
+        self.target_input_panel.retranslate_ui(_)
+        # Merged only now, once the panel has re-registered its own mnemonics
+        self._mnemonics.update(self.target_input_panel.mnemonics)
+        # Status rows are left alone: their strings must match the ones the
+        # controller builds payloads with, and it keeps its startup translator.
+        # Force the next network poll to re-title the target frame in the new language
+        self._browser_name = None
         if self.actions:
+            if self.actions.get_state() != AppState.IDLE:
+                # The panel resets this label to its idle text
+                self.start_stop_button.config(text=_("Stop Pinging"))
             self.actions.update_config(self.actions.get_config())
 
     @property
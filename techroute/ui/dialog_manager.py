@@ -67,8 +67,8 @@ class DialogManager:
     def _center_dialog(self, dialog: tk.Toplevel, width: int, height: int):
         """Centers the dialog on the main window."""
         dialog.withdraw()
-        self.root.update_idletasks()
-        
+        # The main window is already mapped, so its cached geometry is current;
+        # forcing a layout pass here would only re-settle the whole window
         parent_x = self.root.winfo_x()
         parent_y = self.root.winfo_y()
         parent_width = self.root.winfo_width()
@@ -230,12 +230,11 @@ class DialogManager:
             
             self.controller.update_config(new_config)
 
-            language_changed = new_config.get('language') != old_config.get('language')
             if on_save:
                 on_save(old_config, new_config)
 
-            if not language_changed:
-                self.ui.refresh_ui()
+            # Only the settings that actually changed are refreshed
+            self.ui.refresh_ui()
             
             dialog.destroy()
 
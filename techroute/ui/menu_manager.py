@@ -3,7 +3,7 @@ Main menu construction for the TechRoute application UI.
 """
 from __future__ import annotations
 import tkinter as tk
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from .dialog_manager import DialogManager
@@ -17,10 +17,11 @@ class MenuManager:
         self.actions = actions
         self.dialog_manager = dialog_manager
         self._ = translator
+        self.menu_bar: Optional[tk.Menu] = None
 
     def setup(self):
         """Creates the main application menu bar."""
-        menu_bar = tk.Menu(self.root)
+        menu_bar = self.menu_bar = tk.Menu(self.root)
         self.root.config(menu=menu_bar)
 
         def add_menu_item(parent_menu, item_type, label, **kwargs):
@@ -2,12 +2,14 @@
 UI protocol definitions for TechRoute.
 """
 from __future__ import annotations
-from typing import Protocol, Dict, Any, Optional, List, TYPE_CHECKING, Callable
+from typing import AbstractSet, Protocol, Dict, Any, Optional, List, TYPE_CHECKING, Callable
 from tkinter import ttk
 
 if TYPE_CHECKING:
     from ..controller import TechRouteController
     from ..events import AppActions
+    from .animator import Animator
+    from .types import StatusUpdatePayload
 
 
 class AppUIProtocol(Protocol):
@@ -16,17 +18,13 @@ class AppUIProtocol(Protocol):
     and child widgets can expect from the main AppUI class.
     """
     root: Any  # tk.Tk
-    status_widgets: Dict[str, Dict[str, Any]]
+    status_widgets: Dict[str, Any]
     group_frames: Dict[str, ttk.LabelFrame]
     status_indicator: Any  # ttk.Label
     status_bar_label: Any  # ttk.Label
     status_frame: Any  # ttk.Frame
-    ping_animation_job: Optional[str]
-    blinking_animation_job: Optional[str]
     menu_bar: Any  # tk.Menu
-    animation_job: Optional[str]
-    _is_blinking: bool
-    _is_pinging: bool
+    animator: Animator
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -40,24 +38,6 @@ class AppUIProtocol(Protocol):
     def update_status_bar(self, message: str) -> None:
         ...
 
-    def run_ping_animation(self, duration_ms: int) -> None:
-        ...
-
-    def reset_status_indicator(self) -> None:
-        ...
-
-    def start_blinking_animation(self) -> None:
-        ...
-
-    def stop_animation(self) -> None:
-        ...
-
-    def _blink(self) -> None:
-        ...
-
-    def _ping_loop(self, duration_ms: int) -> None:
-        ...
-
     def _show_unsecure_browser_warning(self) -> bool:
         ...
 
@@ -67,7 +47,7 @@ class AppUIProtocol(Protocol):
     def launch_web_ui_for_port(self, original_string: str, port: int) -> None:
         ...
 
-    def refresh_ui(self) -> None:
+    def refresh_ui(self, changed: Optional[AbstractSet[str]] = None) -> None:
         ...
 
     def toggle_ping_process(self) -> None:
@@ -86,11 +66,7 @@ class AppUIProtocol(Protocol):
         """Gets all available web UI URLs."""
         ...
 
-    def add_target_row(self, target_info: Dict[str, Any]) -> None:
-        """Adds a new target row to the status display."""
-        ...
-
-    def update_target_row(self, target_info: Dict[str, Any]) -> None:
+    def update_target_row(self, target_info: StatusUpdatePayload) -> None:
         """Updates a target row in the status display."""
         ...
 
@@ -102,10 +78,14 @@ class AppUIProtocol(Protocol):
         """Creates or updates status widgets for all targets."""
         ...
 
-    def refresh_status_rows_for_settings(self) -> None:
+    def refresh_status_rows_for_settings(self, changed: Optional[AbstractSet[str]] = None) -> None:
         """Updates existing rows after settings change."""
         ...
 
+    def schedule_status_layout(self) -> None:
+        """Re-lays out the status canvas after its content size changed."""
+        ...
+
     def _open_settings_dialog(self, on_save: Callable[[Dict, Dict], None]) -> None:
         ...
 
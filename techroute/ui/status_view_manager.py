@@ -1,19 +1,75 @@
 """
 Status list creation and updates for TechRoute UI.
+
+The list is virtualized: every target lives in a lightweight model, but only
+a small pool of row widgets (enough to fill the visible canvas) is ever
+built. Rows are placed at fixed offsets inside the status frame and are
+rebound to whichever targets scroll into view.
 """
 from __future__ import annotations
+import logging
+import math
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, List, TYPE_CHECKING, Callable
+from typing import AbstractSet, Dict, Any, List, Optional, Tuple, TYPE_CHECKING, Callable
 
-from .widgets.utils import create_indicator_button
-from .styling import TCP_OPEN_COLOR, TCP_CLOSED_COLOR, UDP_OPEN_COLOR, UDP_CLOSED_COLOR
+from .widgets.utils import (
+    PORT_LABEL_KEYS, configure_many, create_indicator_button, place_forget_many, port_label_formatter,
+)
+from .types import StatusUpdatePayload
+from .styling import (
+    INDICATOR_BUTTON_OPTIONS, INDICATOR_LOOKS, TCP_INDICATOR_STYLES, UDP_INDICATOR_STYLES, PING_BUTTON_STYLES,
+)
 
 if TYPE_CHECKING:
     from .app_ui import AppUI
     from .dialog_manager import DialogManager
     from ..events import AppActions
 
+log = logging.getLogger(__name__)
+
+_ROW_PADY = 2
+_PLACEHOLDER_HEIGHT = 60
+_PLACEHOLDER_PAD = 10
+_UDP_SERVICE_ORDER = ["mDNS", "SNMP", "WS-Discovery", "SLP"]
+_WEB_PORTS = frozenset((80, 443, 8080))
+# Look of a freshly bound row before any status for its target has arrived
+_UNKNOWN_LOOK = INDICATOR_LOOKS['Unknown.Indicator']
+# (color, clickable) -> ping button options, merged once per combination
+_PING_LOOKS: Dict[Tuple[str, bool], Dict[str, Any]] = {}
+
+
+def _ping_look(color: str, clickable: bool) -> Dict[str, Any]:
+    look = _PING_LOOKS.get((color, clickable))
+    if look is None:
+        look = _PING_LOOKS[(color, clickable)] = {'bg': color, **PING_BUTTON_STYLES[clickable]}
+    return look
+
+
+class _PoolRow:
+    """One reusable row of widgets plus the target it is currently bound to."""
+    # Slots: these are read for every visible row on every poll
+    __slots__ = (
+        'row_frame', 'label', 'label_var', 'ping_button', 'ping_var',
+        'port_widgets', 'udp_widgets', 'target', 'index', 'last',
+    )
+
+    def __init__(self, row_frame: ttk.Frame, label: ttk.Label, label_var: tk.StringVar,
+                 ping_button: tk.Button, ping_var: tk.StringVar,
+                 port_widgets: Dict[str, tk.Button], udp_widgets: Dict[str, tk.Button]):
+        self.row_frame = row_frame
+        self.label = label
+        self.label_var = label_var
+        self.ping_button = ping_button
+        self.ping_var = ping_var
+        self.port_widgets = port_widgets
+        self.udp_widgets = udp_widgets
+        self.target: Optional[str] = None
+        self.index = -1
+        # Last applied state per widget, so unchanged polls skip Tk entirely
+        self.last: Dict[Any, Any] = {}
+
 class StatusViewManager:
     """Manages the status view widgets."""
 
@@ -24,113 +80,299 @@ class StatusViewManager:
         self.dialog_manager = dialog_manager
         self.ui = ui
         self._ = translator
-        self.status_widgets: Dict[str, Dict[str, Any]] = {}
+        # Targets currently bound to a pooled row (a sparse view of the model)
+        self.status_widgets: Dict[str, _PoolRow] = {}
         self.group_frames: Dict[str, ttk.LabelFrame] = {}
+        self._strings: Dict[str, str] = {}
+        self.retranslate_ui(translator)
+
+        # Model: every target in display order plus its latest payload
+        self._targets: List[str] = []
+        self._latest: Dict[str, Optional[StatusUpdatePayload]] = {}
+        # Pooled row widgets; slot i shows every target whose index % len(pool) == i
+        self._row_pool: List[_PoolRow] = []
+        # (first index, pool size) last bound by refresh_visible; None forces a rebind
+        self._visible_window: Optional[Tuple[int, int]] = None
+        self._row_layout: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+        self._row_height = 0
+        # Height of the status frame, kept here so the canvas never has to measure it
+        self.content_height = 0
+        # Port -> label function for the current readability setting
+        self._port_fmt: Callable[[Any], str] = str
+        # Port as reported by a poll -> (button key, interned label); rebuilt with _port_fmt
+        self._port_labels: Dict[Any, Tuple[str, str]] = {}
+        # Targets whose latest payload reports a web port open; kept in step with _latest
+        self.web_open_count = 0
+        self._placeholder: Optional[ttk.Frame] = None
+        self._placeholder_label: Optional[ttk.Label] = None
+
+    def retranslate_ui(self, translator: Callable[[str], str]):
+        """Caches the translated strings used on every row update."""
+        self._ = translator
+        self._strings = {
+            'pinging': translator('Pinging...'),
+            'ping': translator('PING'),
+            'online': translator('Online'),
+            'offline': translator('Offline'),
+            'fail': translator('FAIL'),
+            'waiting': translator('Waiting for targets...'),
+        }
 
     def setup_status_display(self, targets: List[Dict[str, Any]]):
-        """Creates or updates status widgets for each target."""
-        for widget in self.status_frame.winfo_children():
-            widget.destroy()
+        """Resets the model to the given targets and shows the visible slice."""
+        self._targets = []
+        self._latest.clear()
+        self.web_open_count = 0
+        self._visible_window = None
         self.status_widgets.clear()
         self.group_frames.clear()
+        # Unbind every pooled row, but unplace them all in one Tcl call
+        placed = []
+        for row in self._row_pool:
+            row.target = None
+            if row.index != -1:
+                row.index = -1
+                placed.append(row.row_frame)
+        place_forget_many(self.status_frame, placed)
 
         if not targets:
-            placeholder_frame = ttk.Frame(self.status_frame, height=60)
-            placeholder_frame.pack(pady=10, padx=10, fill=tk.X, expand=True)
-            placeholder_label = ttk.Label(placeholder_frame, text=self._("Waiting for targets..."), foreground="gray")
-            placeholder_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+            self._show_placeholder()
             return
 
-        for target_info in targets:
-            self.add_target_row(target_info)
-
-    def refresh_status_rows_for_settings(self):
-        """Update existing rows after settings changed."""
-        readability = self.actions.get_config().get('tcp_port_readability', 'Numbers')
-        service_map = self.actions.get_config().get('port_service_map', {})
-
-        for original_string, widgets in self.status_widgets.items():
-            latest = None
-            all_targets = self.actions.get_all_targets_with_status()
-            for t in all_targets:
-                if t.get('original_string') == original_string:
-                    latest = t
-                    break
-            if latest:
-                status = latest.get('status', widgets.get('status', ''))
-                widgets['label'].config(text=f"{self.actions.extract_host(original_string)}: {status}")
-                port_statuses = latest.get('port_statuses') or {}
-                for port, btn in widgets.get('port_widgets', {}).items():
-                    display_text = port
-                    if readability == 'Simple':
-                        display_text = service_map.get(str(port), str(port))
-                    btn.config(text=display_text)
-        if not self.status_widgets:
-            for child in self.status_frame.winfo_children():
-                if isinstance(child, ttk.Frame):
-                    for lab in child.winfo_children():
-                        if isinstance(lab, ttk.Label):
-                            try:
-                                lab.config(text=self._("Waiting for targets..."))
-                            except Exception:
-                                pass
-
-    def add_target_row(self, target_info: Dict[str, Any]):
-        """Creates a single row of widgets for a target."""
-        parent = self.status_frame
-        original_string = target_info['original_string']
-        
-        row_frame = ttk.Frame(parent)
-        row_frame.pack(fill=tk.X, expand=True, pady=2)
-
-        ping_button = tk.Button(
-            row_frame, text="PING", width=5, bg="gray", fg="white",
-            disabledforeground="white", relief="raised", borderwidth=1,
-            state=tk.DISABLED, cursor=""
+        self._hide_placeholder()
+        self._set_port_fmt(port_label_formatter(self.actions.get_config()))
+        layout = self._current_row_layout()
+        if layout != self._row_layout:
+            # Port/service set changed, so pooled rows have the wrong buttons
+            for row in self._row_pool:
+                row.row_frame.destroy()
+            self._row_pool.clear()
+            self._row_layout = layout
+
+        # Bulk load: fill the model in one pass; the size change below arms a
+        # single trailing layout pass for the scrollregion, not one per row
+        self._targets = [target_info['original_string'] for target_info in targets]
+        self._latest.update(dict.fromkeys(self._targets))  # No poll results yet
+
+        self._resize_content()
+        self.refresh_visible()
+
+    def _show_placeholder(self):
+        if self._placeholder is None:
+            self._placeholder = ttk.Frame(self.status_frame, height=_PLACEHOLDER_HEIGHT)
+            self._placeholder_label = ttk.Label(self._placeholder, text=self._strings['waiting'], foreground="gray")
+            self._placeholder_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._placeholder.place(
+            x=_PLACEHOLDER_PAD, y=_PLACEHOLDER_PAD, relwidth=1.0,
+            width=-2 * _PLACEHOLDER_PAD, height=_PLACEHOLDER_HEIGHT
         )
+        self._set_content_height(_PLACEHOLDER_HEIGHT + 2 * _PLACEHOLDER_PAD)
+
+    def _hide_placeholder(self):
+        if self._placeholder is not None:
+            self._placeholder.place_forget()
+
+    def _current_row_layout(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Returns the TCP ports and UDP services each row needs buttons for."""
+        all_tcp_ports = self.actions.get_config().get('default_ports_to_check', [])
+        checker_names = sorted(
+            (c.name for c in self.actions.get_service_checkers()),
+            key=_UDP_SERVICE_ORDER.index
+        )
+        return tuple(str(p) for p in all_tcp_ports), tuple(checker_names)
+
+    def _resize_content(self):
+        """Sizes the status frame to hold every target, built or not."""
+        self._ensure_pool(1)
+        self._set_content_height(len(self._targets) * self._row_height)
+
+    def _set_content_height(self, height: int):
+        """Resizes the status frame and asks the UI to re-lay out the canvas.
+
+        The height is known here, so the UI is told directly instead of
+        waiting for the frame's <Configure> to round-trip through Tk.
+        """
+        if height == self.content_height:
+            return
+        self.content_height = height
+        self.status_frame.configure(height=height)
+        self.ui.schedule_status_layout()
+
+    def refresh_status_rows_for_settings(self, changed: Optional[AbstractSet[str]] = None):
+        """Relabels the pooled rows' port buttons in place after settings changed.
+
+        When changed is given, nothing is done unless a port label key is in it.
+        """
+        if changed is not None and changed.isdisjoint(PORT_LABEL_KEYS):
+            return
+        self._set_port_fmt(port_label_formatter(self.actions.get_config()))
+        if self._row_layout:
+            text_by_port = {port: self._port_label(port)[1] for port in self._row_layout[0]}
+            pairs = []
+            for row in self._row_pool:
+                last = row.last
+                for port, btn in row.port_widgets.items():
+                    text = text_by_port[port]
+                    pairs.append((btn, text))
+                    # Keep the per-widget cache in step so the next poll doesn't relabel again
+                    state = last.get(('port', port))
+                    if state is not None:
+                        last[('port', port)] = (text, state[1])
+            configure_many(self.status_frame, 'text', pairs)
+        if self._placeholder_label is not None:
+            try:
+                self._placeholder_label.config(text=self._strings['waiting'])
+            except tk.TclError:
+                pass
+
+    def _set_port_fmt(self, fmt: Callable[[Any], str]):
+        self._port_fmt = fmt
+        self._port_labels = {}
+
+    def _port_label(self, port: Any) -> Tuple[str, str]:
+        """Returns (button key, display label) for a port, formatting each port once."""
+        entry = self._port_labels.get(port)
+        if entry is None:
+            key = str(port)
+            # Interned so the per-poll (label, open) comparisons usually hit on identity
+            entry = self._port_labels[port] = (key, sys.intern(self._port_fmt(key)))
+        return entry
+
+    # ------------------- Row pool -------------------
+
+    def _build_pool_row(self) -> _PoolRow:
+        """Creates one reusable row of widgets, not yet bound to a target."""
+        tcp_ports, checker_names = self._row_layout or self._current_row_layout()
+        row_frame = ttk.Frame(self.status_frame)
+
+        # Texts go through Tcl variables: a poll's text change is then one `set`
+        # instead of a widget configure with option parsing
+        ping_var = tk.StringVar(row_frame, value="PING")
+        ping_button = tk.Button(row_frame, textvariable=ping_var, width=5, **INDICATOR_BUTTON_OPTIONS)
         ping_button.pack(side=tk.LEFT, padx=(0, 10))
 
         port_frame = ttk.Frame(row_frame)
         port_frame.pack(side=tk.RIGHT, padx=(5, 0))
 
-        label = ttk.Label(row_frame, text=f"{self.actions.extract_host(original_string)}: {self._('Pinging...')}")
+        label_var = tk.StringVar(row_frame)
+        label = ttk.Label(row_frame, textvariable=label_var)
         label.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         port_widgets = {}
         udp_widgets = {}
-        readability = self.actions.get_config().get('tcp_port_readability', 'Numbers')
-        service_map = self.actions.get_config().get('port_service_map', {})
-        all_tcp_ports = self.actions.get_config().get('default_ports_to_check', [])
-        
-        for port in all_tcp_ports:
-            display_text = str(port)
-            if readability == 'Simple':
-                display_text = service_map.get(str(port), str(port))
-            port_button = create_indicator_button(port_frame, display_text)
+        for port in tcp_ports:
+            port_button = create_indicator_button(port_frame, self._port_label(port)[1])
             port_button.pack(side=tk.LEFT, padx=1)
-            port_widgets[str(port)] = port_button
+            port_widgets[port] = port_button
 
-        if self.actions and self.actions.get_service_checkers():
-            if all_tcp_ports:
+        if checker_names:
+            if tcp_ports:
                 sep = ttk.Separator(port_frame, orient=tk.VERTICAL)
                 sep.pack(side=tk.LEFT, padx=5, fill=tk.Y)
-
-            sorted_checkers = sorted(
-                self.actions.get_service_checkers(),
-                key=lambda c: ["mDNS", "SNMP", "WS-Discovery", "SLP"].index(c.name)
-            )
-            for checker in sorted_checkers:
-                udp_btn = create_indicator_button(port_frame, checker.name)
+            for name in checker_names:
+                udp_btn = create_indicator_button(port_frame, name)
                 udp_btn.pack(side=tk.LEFT, padx=1)
-                udp_widgets[checker.name] = udp_btn
+                udp_widgets[name] = udp_btn
 
-        self.status_widgets[original_string] = {
-            "row_frame": row_frame, "label": label, "ping_button": ping_button,
-            "port_widgets": port_widgets, "udp_widgets": udp_widgets,
-            "group_frame": parent, "status": self._('Pinging...')
-        }
-        
-        self.update_target_row(target_info)
+        if not self._row_height:
+            # Buttons and labels compute their requested size on creation
+            content = max([ping_button.winfo_reqheight(), label.winfo_reqheight()] +
+                          [b.winfo_reqheight() for b in port_widgets.values()])
+            self._row_height = content + 2 * _ROW_PADY
+            # Scroll in whole rows, as a list widget would; each step then
+            # moves the visible window by exactly one pooled row
+            self.ui.status_canvas.configure(yscrollincrement=self._row_height)
+
+        row = _PoolRow(row_frame, label, label_var, ping_button, ping_var, port_widgets, udp_widgets)
+        # Commands resolve the row's current target when clicked, so they are set
+        # once here and never rebuilt per poll; closed indicators are disabled anyway
+        click = self._on_row_indicator_click
+        ping_button.configure(command=lambda: click(row, "80", True))
+        for port, btn in port_widgets.items():
+            btn.configure(command=lambda p=port, web=int(port) in _WEB_PORTS: click(row, p, web))
+        for name, btn in udp_widgets.items():
+            btn.configure(command=lambda n=name: click(row, n, False))
+        return row
+
+    def _ensure_pool(self, size: int):
+        while len(self._row_pool) < size:
+            self._row_pool.append(self._build_pool_row())
+
+    def _visible_row_count(self) -> int:
+        canvas_height = max(1, self.ui.status_canvas.winfo_height())
+        return math.ceil(canvas_height / self._row_height) + 2
+
+    def refresh_visible(self):
+        """Binds pooled rows to whichever targets are inside the viewport."""
+        total = len(self._targets)
+        if not total:
+            return
+        self._ensure_pool(1)
+        row_height = self._row_height
+        self._ensure_pool(min(total, self._visible_row_count()))
+        pool = self._row_pool
+        pool_size = len(pool)
+
+        top = max(0, int(self.ui.status_canvas.canvasy(0)))
+        first = min(top // row_height, max(0, total - pool_size))
+        # Scrolling fires per pixel; rows only need rebinding when a row boundary is crossed
+        if self._visible_window == (first, pool_size):
+            return
+        self._visible_window = (first, pool_size)
+        wanted = {}
+        for index in range(first, min(total, first + pool_size)):
+            wanted[index % pool_size] = index
+
+        for slot, row in enumerate(pool):
+            index = wanted.get(slot)
+            if index is None:
+                self._unbind_row(row)
+                continue
+            if row.index != index:
+                row.index = index
+                row.row_frame.place(
+                    x=0, y=index * row_height + _ROW_PADY, relwidth=1.0,
+                    height=row_height - 2 * _ROW_PADY
+                )
+            self._bind_row(row, self._targets[index])
+
+    def _unbind_row(self, row: _PoolRow):
+        target = row.target
+        if target is not None and self.status_widgets.get(target) is row:
+            del self.status_widgets[target]
+        row.target = None
+        if row.index != -1:
+            row.index = -1
+            row.row_frame.place_forget()
+
+    def _bind_row(self, row: _PoolRow, target: str):
+        """Points a pooled row at a target and paints its latest known state."""
+        if row.target == target:
+            return
+        old = row.target
+        if old is not None and self.status_widgets.get(old) is row:
+            del self.status_widgets[old]
+        row.target = target
+        row.last = {}
+        self.status_widgets[target] = row
+
+        # Back to the "no data yet" look before applying whatever we know
+        row.label_var.set(f"{self.actions.extract_host(target)}: {self._strings['pinging']}")
+        row.ping_var.set(self._strings['ping'])
+        row.ping_button.config(**_UNKNOWN_LOOK)
+        for port, btn in row.port_widgets.items():
+            btn.config(text=self._port_label(port)[1], **_UNKNOWN_LOOK)
+        for btn in row.udp_widgets.values():
+            btn.config(**_UNKNOWN_LOOK)
+
+        latest = self._latest.get(target)
+        if latest is not None:
+            self._apply_to_row(row, latest)
+
+    def _on_row_indicator_click(self, row: _PoolRow, port_or_service: str, is_web_port: bool):
+        target = row.target
+        if target is not None:
+            self._on_service_indicator_click(target, port_or_service, is_web_port)
 
     def _on_service_indicator_click(self, target: str, port_or_service: str, is_web_port: bool):
         """Handles clicks on any service indicator button."""
@@ -149,72 +391,78 @@ class StatusViewManager:
                 parent=self.root
             )
 
-    def update_target_row(self, target_info: Dict[str, Any]):
-        """Updates a single row of widgets for a target with new data."""
-        original_string = target_info['original_string']
+    def update_target_row(self, target_info: StatusUpdatePayload):
+        """Records a target's latest data and repaints its row if one is bound."""
+        original_string = target_info.original_string
+        if original_string not in self._latest:
+            # Late result for a target dropped by a stop/restart; nothing to paint
+            log.debug("Status update for %s but no such target", original_string)
+            return
+        previous = self._latest[original_string]
+        if previous == target_info:
+            return  # Same payload as last tick; nothing on screen would change
+        was_open = previous is not None and previous.web_port_open
+        if target_info.web_port_open != was_open:
+            self.web_open_count += 1 if target_info.web_port_open else -1
+        self._latest[original_string] = target_info
         widgets = self.status_widgets.get(original_string)
         if not widgets:
             return
+        self._apply_to_row(widgets, target_info)
 
-        status = target_info.get('status', self._('Pinging...'))
-        color = target_info.get('color', 'gray')
-        latency_str = target_info.get('latency_str', '')
-        web_port_open = target_info.get('web_port_open', False)
-        port_statuses = target_info.get('port_statuses')
-        udp_service_statuses = target_info.get('udp_service_statuses')
+    def _apply_to_row(self, widgets: _PoolRow, target_info: StatusUpdatePayload):
+        """Paints a payload onto a bound row, touching only widgets that changed."""
+        original_string, status, color, latency_str, port_statuses, web_port_open, udp_service_statuses = target_info
+        strings = self._strings
 
-        ping_button_text = self._("PING")
-        if status == self._("Online"):
+        ping_button_text = strings['ping']
+        if status == strings['online']:
             ping_button_text = latency_str
-        elif status == self._("Offline"):
-            ping_button_text = self._("FAIL")
-        
-        widgets['ping_button'].config(
-            text=ping_button_text, bg=color,
-            state=tk.NORMAL if web_port_open else tk.DISABLED,
-            cursor="hand2" if web_port_open else ""
-        )
-        if web_port_open:
-            widgets['ping_button'].config(
-                command=lambda s=original_string: self._on_service_indicator_click(s, "80", is_web_port=True)
-            )
+        elif status == strings['offline']:
+            ping_button_text = strings['fail']
+
+        last = widgets.last
+        # Latency changes nearly every poll, the look only on transitions
+        if last.get('ping_text') != ping_button_text:
+            last['ping_text'] = ping_button_text
+            widgets.ping_var.set(ping_button_text)
+        ping_look = (color, web_port_open)
+        if last.get('ping') != ping_look:
+            last['ping'] = ping_look
+            widgets.ping_button.config(**_ping_look(color, web_port_open))
 
-        widgets['label'].config(text=f"{self.actions.extract_host(original_string)}: {status}")
+        if last.get('status') != status:
+            last['status'] = status
+            widgets.label_var.set(f"{self.actions.extract_host(original_string)}: {status}")
 
         if port_statuses:
-            readability = self.actions.get_config().get('tcp_port_readability', 'Numbers')
-            service_map = self.actions.get_config().get('port_service_map', {})
+            # Hoisted out of the loop: this runs for every port of every row on every poll
+            port_labels = self._port_labels
+            port_widgets = widgets.port_widgets
+            last_get = last.get
+            open_style, closed_style = TCP_INDICATOR_STYLES[True], TCP_INDICATOR_STYLES[False]
             for port, port_status in port_statuses.items():
-                port_button = widgets['port_widgets'].get(str(port))
+                port_key, display_text = port_labels.get(port) or self._port_label(port)
+                port_button = port_widgets.get(port_key)
                 if port_button:
                     is_open = (port_status == "Open")
-                    display_text = str(port)
-                    if readability == 'Simple':
-                        display_text = service_map.get(str(port), str(port))
-                    
-                    port_button.config(
-                        text=display_text,
-                        bg=TCP_OPEN_COLOR if is_open else TCP_CLOSED_COLOR,
-                        state=tk.NORMAL if is_open else tk.DISABLED,
-                        cursor="hand2" if is_open else ""
-                    )
-                    is_web_port = int(port) in [80, 443, 8080]
-                    if is_open:
-                        port_button.config(
-                            command=lambda s=original_string, p=port, web=is_web_port: self._on_service_indicator_click(s, p, web)
-                        )
+                    port_state = (display_text, is_open)
+                    last_key = ('port', port)
+                    if last_get(last_key) == port_state:
+                        continue
+                    last[last_key] = port_state
+                    port_button.config(text=display_text, **(open_style if is_open else closed_style))
 
         if udp_service_statuses:
+            udp_widgets = widgets.udp_widgets
+            last_get = last.get
+            open_style, closed_style = UDP_INDICATOR_STYLES[True], UDP_INDICATOR_STYLES[False]
             for svc_name, svc_status in udp_service_statuses.items():
-                udp_btn = widgets['udp_widgets'].get(svc_name)
+                udp_btn = udp_widgets.get(svc_name)
                 if udp_btn:
                     is_open = (svc_status == "Open")
-                    udp_btn.config(
-                        bg=UDP_OPEN_COLOR if is_open else UDP_CLOSED_COLOR,
-                        state=tk.NORMAL if is_open else tk.DISABLED,
-                        cursor="hand2" if is_open else ""
-                    )
-                    if is_open:
-                        udp_btn.config(
-                            command=lambda s=original_string, svc=svc_name: self._on_service_indicator_click(s, svc, is_web_port=False)
-                        )
+                    last_key = ('udp', svc_name)
+                    if last_get(last_key) == is_open:
+                        continue
+                    last[last_key] = is_open
+                    udp_btn.config(**(open_style if is_open else closed_style))
@@ -12,3 +12,39 @@ UDP_CLOSED_COLOR = "#FF9800"  # Orange
 
 # Default color for indicators before a status is known
 DEFAULT_INDICATOR_COLOR = "gray"
+
+# Named indicator looks. These play the role of ttk styles: the native ttk
+# themes (vista, aqua) ignore button background colors, so indicators stay
+# tk.Buttons and a look is a pre-built option set applied in one config call.
+INDICATOR_LOOKS = {
+    'Unknown.Indicator': {'bg': DEFAULT_INDICATOR_COLOR, 'state': 'disabled', 'cursor': ''},
+    'Open.TCP.Indicator': {'bg': TCP_OPEN_COLOR, 'state': 'normal', 'cursor': 'hand2'},
+    'Closed.TCP.Indicator': {'bg': TCP_CLOSED_COLOR, 'state': 'disabled', 'cursor': ''},
+    'Open.UDP.Indicator': {'bg': UDP_OPEN_COLOR, 'state': 'normal', 'cursor': 'hand2'},
+    'Closed.UDP.Indicator': {'bg': UDP_CLOSED_COLOR, 'state': 'disabled', 'cursor': ''},
+}
+
+# Construction options shared by every indicator button; only text and width
+# vary. Buttons start in the Unknown look, so its colour is defined once.
+INDICATOR_BUTTON_OPTIONS = {
+    **INDICATOR_LOOKS['Unknown.Indicator'],
+    'fg': "white",
+    'disabledforeground': "white",
+    'relief': "raised",
+    'borderwidth': 1,
+}
+
+# Looks keyed by "is open", so each status change is a single lookup
+TCP_INDICATOR_STYLES = {
+    True: INDICATOR_LOOKS['Open.TCP.Indicator'],
+    False: INDICATOR_LOOKS['Closed.TCP.Indicator'],
+}
+UDP_INDICATOR_STYLES = {
+    True: INDICATOR_LOOKS['Open.UDP.Indicator'],
+    False: INDICATOR_LOOKS['Closed.UDP.Indicator'],
+}
+# The ping button is only clickable when the target exposes a web port
+PING_BUTTON_STYLES = {
+    True: {'state': 'normal', 'cursor': 'hand2'},
+    False: {'state': 'disabled', 'cursor': ''},
+}
@@ -2,7 +2,7 @@
 Shared typing information for the UI layer.
 """
 from __future__ import annotations
-from typing import Protocol, Dict, Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+from typing import Protocol, Dict, Any, Callable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 from tkinter import ttk
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -19,7 +19,20 @@ class AppState(Enum):
     PINGING = auto()
     STOPPING = auto()
 
-StatusUpdatePayload = Dict[str, Any]
+class StatusUpdatePayload(NamedTuple):
+    """One target's display state, rebuilt by the controller on every poll.
+
+    A tuple rather than a dict: it is created per target per tick, and rows
+    read it by attribute instead of hashing string keys.
+    """
+    original_string: str
+    status: str
+    color: str
+    latency_str: str
+    port_statuses: Dict[str, str]
+    web_port_open: bool
+    udp_service_statuses: Dict[str, str]
+
 NetworkInfoPayload = Dict[str, Any]
 
 # ------------------- Protocols for Decoupling -------------------
@@ -1,15 +1,38 @@
 """
 A widget for displaying network information.
 """
+import logging
 import tkinter as tk
+import tkinter.font as tkfont
 import time
+from concurrent.futures import Future
 from tkinter import ttk
-from typing import Callable, Dict, Any, List
+from typing import AbstractSet, Callable, Dict, Any, List, Optional, Tuple
 
 from ...checkers import get_udp_service_registry
-from ...network import check_tcp_port
-from .utils import create_indicator_button
-from ..styling import TCP_OPEN_COLOR, TCP_CLOSED_COLOR, UDP_OPEN_COLOR, UDP_CLOSED_COLOR
+from ...network import check_tcp_ports, get_probe_executor, has_ipv6_loopback
+from .utils import PORT_LABEL_KEYS, port_label_formatter
+from ..styling import DEFAULT_INDICATOR_COLOR, TCP_INDICATOR_STYLES, UDP_INDICATOR_STYLES
+
+log = logging.getLogger(__name__)
+
+
+def _local_hosts() -> Tuple[str, ...]:
+    """Loopback addresses to probe; ::1 is skipped where it cannot be used."""
+    # has_ipv6_loopback() is cached, so its socket check runs on the first probe only
+    return ("127.0.0.1", "::1") if has_ipv6_loopback() else ("127.0.0.1",)
+
+# Loopback answers fast, so local probes use a short timeout
+_LOCAL_PROBE_TIMEOUT = 0.2
+# How often the Tk side re-checks a probe cycle that outlived its timeout
+_PROBE_POLL_MS = 50
+
+# Geometry of the local service indicators drawn on the canvas
+_INDICATOR_PAD_X = 6
+_INDICATOR_PAD_Y = 3
+_INDICATOR_GAP = 4
+_SEPARATOR_GAP = 5
+_SEPARATOR_COLOR = "#a0a0a0"
 
 class NetworkInfoPanel(ttk.Frame):
     """A frame that displays network information."""
@@ -17,7 +40,15 @@ class NetworkInfoPanel(ttk.Frame):
     def __init__(self, parent: tk.Widget, translator: Callable[[str], str]):
         super().__init__(parent)
         self._ = translator
-        self.local_service_indicators: Dict[int, tk.Button] = {}
+        # port -> (rectangle, text) canvas items; all indicators share one canvas
+        self.local_service_indicators: Dict[int, Tuple[int, int]] = {}
+        self._service_separator: Optional[int] = None
+        # Port -> label function for the current readability setting
+        self._port_fmt: Callable[[Any], str] = str
+        self._separator_before: Optional[int] = None
+        # port -> (open, closed) background, resolved once when the indicator is built
+        self._indicator_colors: Dict[int, Tuple[str, str]] = {}
+        self._applied_colors: Dict[int, str] = {}
         self._local_service_ports = [20, 21, 22, 445]
         # Cached network info for hysteresis (avoid reverting to Detecting...)
         self._cached_network_info = {}
@@ -28,54 +59,71 @@ class NetworkInfoPanel(ttk.Frame):
         # Configuration for hysteresis thresholds
         self._close_confirm_threshold = 2  # require N consecutive Closed readings before showing Closed
         self._open_confirm_threshold = 1   # a single Open reading is enough
+        # Monotonic deadline for the next local probe; 0 means "as soon as idle"
+        self._next_probe_due = 0.0
+        # True while a probe cycle is in flight on the local probe pool
+        self._probe_running = False
+        # The armed after() for the next probe, so a wake-up can pull it forward
+        self._probe_job: Optional[str] = None
+        # Bound once; these are re-armed through after() on every probe cycle
+        self._start_check_cb = self.start_local_services_check
+        self._collect_probe_cb = self._collect_probe_results
+        # Adaptive probe cadence: backs off while results repeat, resets on change
+        self._probe_interval = 0.0
+        self._last_probe_snapshot: Optional[Tuple[Tuple[int, str], ...]] = None
+        self._indicator_font: Optional[tkfont.Font] = None
+        # True once every indicator's confirmed state matches the last probe
+        self._indicators_settled = False
 
         self.network_frame = ttk.LabelFrame(self, text=self._("Network Information"), padding="10")
         self.network_frame.pack(fill=tk.X, expand=True)
 
         netgrid = self.network_frame
+        # One Tcl variable per field: updates are a single `set` each and the
+        # labels redraw through -textvariable, with no per-label configure.
+        detecting = self._("Detecting…")
+        self._netinfo_vars: Dict[str, tk.StringVar] = {
+            key: tk.StringVar(self, value=detecting)
+            for key in ("primary_ipv4", "primary_ipv6", "gateway", "subnet_mask")
+        }
+        self._netinfo_shown: Dict[str, str] = dict.fromkeys(self._netinfo_vars, detecting)
         self.ipv4_label = ttk.Label(netgrid, text=self._("IPv4:"))
         self.ipv4_label.grid(row=0, column=0, sticky="w")
-        self.netinfo_v4 = ttk.Label(netgrid, text=self._("Detecting…"))
+        self.netinfo_v4 = ttk.Label(netgrid, textvariable=self._netinfo_vars["primary_ipv4"])
         self.netinfo_v4.grid(row=0, column=1, sticky="w", padx=(6, 0))
         
         self.ipv6_label = ttk.Label(netgrid, text=self._("IPv6:"))
         self.ipv6_label.grid(row=0, column=2, sticky="w", padx=(16, 0))
-        self.netinfo_v6 = ttk.Label(netgrid, text=self._("Detecting…"))
+        self.netinfo_v6 = ttk.Label(netgrid, textvariable=self._netinfo_vars["primary_ipv6"])
         self.netinfo_v6.grid(row=0, column=3, sticky="w", padx=(6, 0))
 
         self.gateway_label = ttk.Label(netgrid, text=self._("Gateway:"))
         self.gateway_label.grid(row=1, column=0, sticky="w", pady=(4, 0))
-        self.netinfo_gw = ttk.Label(netgrid, text=self._("Detecting…"))
+        self.netinfo_gw = ttk.Label(netgrid, textvariable=self._netinfo_vars["gateway"])
         self.netinfo_gw.grid(row=1, column=1, sticky="w", padx=(6, 0), pady=(4, 0))
 
         self.subnet_label = ttk.Label(netgrid, text=self._("Subnet Mask:"))
         self.subnet_label.grid(row=1, column=2, sticky="w", padx=(16, 0), pady=(4, 0))
-        self.netinfo_mask = ttk.Label(netgrid, text=self._("Detecting…"))
+        self.netinfo_mask = ttk.Label(netgrid, textvariable=self._netinfo_vars["subnet_mask"])
         self.netinfo_mask.grid(row=1, column=3, sticky="w", padx=(6, 0), pady=(4, 0))
 
         self.local_services_label = ttk.Label(netgrid, text=self._("Local Services:"))
         self.local_services_label.grid(row=2, column=0, sticky="w", pady=(4, 0))
-        self.local_services_frame = ttk.Frame(netgrid)
-        self.local_services_frame.grid(row=2, column=1, columnspan=3, sticky="w", padx=(6, 0), pady=(4, 0))
+        # Indicators are display-only, so they are drawn as canvas items rather
+        # than one Tk button (and native window) each
+        self.local_services_canvas = tk.Canvas(
+            netgrid, width=1, height=1, highlightthickness=0, borderwidth=0,
+            background=ttk.Style(self).lookup('TFrame', 'background') or None
+        )
+        self.local_services_canvas.grid(row=2, column=1, columnspan=3, sticky="w", padx=(6, 0), pady=(4, 0))
 
     def setup_local_services(self, config: Dict[str, Any]):
-        """Creates the local service indicator buttons."""
-        readability = config.get('tcp_port_readability', 'Numbers')
-        service_map = config.get('port_service_map', {})
-
+        """Creates the local service indicators."""
+        self._port_fmt = fmt = port_label_formatter(config)
         for p in self._local_service_ports:
-            display_text = str(p)
-            if readability == 'Simple':
-                display_text = service_map.get(str(p), str(p))
-            btn = create_indicator_button(self.local_services_frame, display_text)
-            btn.pack(side=tk.LEFT, padx=(0, 4))
-            self.local_service_indicators[p] = btn
+            self._add_indicator(p, fmt(p), TCP_INDICATOR_STYLES)
 
         udp_ports_cfg = config.get('udp_services_to_check', [])
-        # Add separator between TCP and UDP services
-        if self._local_service_ports and udp_ports_cfg:
-            sep = ttk.Separator(self.local_services_frame, orient=tk.VERTICAL)
-            sep.pack(side=tk.LEFT, padx=5, fill=tk.Y)
         if udp_ports_cfg:
             registry = get_udp_service_registry()
             ordered_services = [
@@ -87,103 +135,185 @@ class NetworkInfoPanel(ttk.Frame):
             
             for service_name, port in ordered_services:
                 if port in udp_ports_cfg:
-                    btn = create_indicator_button(self.local_services_frame, service_name)
-                    btn.pack(side=tk.LEFT, padx=(0, 4))
-                    self.local_service_indicators[port] = btn
-        
-        self.after(100, lambda: self.start_local_services_check(config))
+                    if self._local_service_ports and self._separator_before is None:
+                        # Separator between TCP and UDP services
+                        self._separator_before = port
+                        self._service_separator = self.local_services_canvas.create_line(
+                            0, 0, 0, 0, fill=_SEPARATOR_COLOR
+                        )
+                    self._add_indicator(port, service_name, UDP_INDICATOR_STYLES)
+
+        self._layout_local_services()
+        self.after_idle(self._schedule_local_services_check, config)
+
+    def _add_indicator(self, port: int, text: str, styles: Dict[bool, Dict[str, Any]]) -> None:
+        """Draws one indicator; _layout_local_services positions it."""
+        canvas = self.local_services_canvas
+        rect = canvas.create_rectangle(0, 0, 0, 0, fill=DEFAULT_INDICATOR_COLOR, outline="")
+        label = canvas.create_text(0, 0, text=text, fill="white", font="TkDefaultFont")
+        self.local_service_indicators[port] = (rect, label)
+        self._indicator_colors[port] = (styles[True]['bg'], styles[False]['bg'])
+
+    def _layout_local_services(self) -> None:
+        """Lays the indicators out left to right, sized to their labels."""
+        canvas = self.local_services_canvas
+        if self._indicator_font is None:
+            # nametofont lists every Tk font to validate the name; do it once
+            self._indicator_font = tkfont.nametofont("TkDefaultFont")
+        font = self._indicator_font
+        height = font.metrics("linespace") + 2 * _INDICATOR_PAD_Y
+        x = 0
+        for port, (rect, label) in self.local_service_indicators.items():
+            if port == self._separator_before and self._service_separator is not None:
+                x += _SEPARATOR_GAP - _INDICATOR_GAP
+                canvas.coords(self._service_separator, x, 1, x, height - 1)
+                x += _SEPARATOR_GAP + 1
+            width = font.measure(canvas.itemcget(label, "text")) + 2 * _INDICATOR_PAD_X
+            canvas.coords(rect, x, 0, x + width, height)
+            canvas.coords(label, x + width / 2, height / 2)
+            x += width + _INDICATOR_GAP
+        canvas.configure(width=max(1, x - _INDICATOR_GAP), height=height)
+
+    def _next_probe_interval(self, repeated: bool, config: Dict[str, Any]) -> float:
+        """Doubles the probe interval while results repeat; resets it when any port changes."""
+        base = float(config.get('local_services_refresh_seconds', 2))
+        cap = max(base, float(config.get('local_services_max_refresh_seconds', 60)))
+        if repeated:
+            self._probe_interval = min(cap, max(base, self._probe_interval * 2))
+        else:
+            self._probe_interval = base
+        return self._probe_interval
+
+    def _schedule_local_services_check(self, config: Dict[str, Any]) -> None:
+        """Arms the next local probe for whenever it is actually due."""
+        delay_ms = max(5, int((self._next_probe_due - time.monotonic()) * 1000))
+        self._probe_job = self.after(delay_ms, self._start_check_cb, config)
+
+    def wake_local_services_check(self, config: Dict[str, Any]) -> None:
+        """Probes now and drops back to the base interval, cutting any backoff short."""
+        self._probe_interval = 0.0
+        if self._probe_job is None or self._probe_running:
+            return  # Not started yet, or a probe is already in flight
+        self.after_cancel(self._probe_job)
+        self._probe_job = None
+        self._next_probe_due = 0.0
+        self.start_local_services_check(config)
 
     def start_local_services_check(self, config: Dict[str, Any]) -> None:
-        """Kicks off a parallel check of local TCP and UDP ports."""
-        import threading
-        from collections import defaultdict
+        """Kicks off a concurrent check of local TCP and UDP ports."""
+        self._probe_job = None
+        if self._probe_running:
+            return
+        try:
+            probes = self._submit_local_probes(list(self._local_service_ports), config)
+        except RuntimeError:
+            return  # The probe pool was shut down: the app is closing
+        self._probe_running = True
+        # The pool threads never touch Tk; results are collected from here,
+        # normally in one go once the probe timeout has passed
+        self.after(int(_LOCAL_PROBE_TIMEOUT * 1000) + _PROBE_POLL_MS, self._collect_probe_cb, probes, config)
 
-        if getattr(self, "_local_services_thread_running", False): return
-        setattr(self, "_local_services_thread_running", True)
+    def _submit_local_probes(self, tcp_ports: List[int], config: Dict[str, Any]) -> List[Future]:
+        """Submits every local TCP batch and UDP service probe to the local probe pool.
+
+        Each future resolves to a {port: status} dict.
+        """
+        executor = get_probe_executor()
+        hosts = _local_hosts()
+        # One selector-driven batch per loopback address covers every TCP port
+        probes = [
+            executor.submit(check_tcp_ports, host, tcp_ports, _LOCAL_PROBE_TIMEOUT)
+            for host in hosts
+        ] if tcp_ports else []
 
-        def _worker():
+        udp_ports_cfg = config.get('udp_services_to_check', [])
+        if udp_ports_cfg:
+            registry = get_udp_service_registry()
+            for udp_port in udp_ports_cfg:
+                entry = registry.get(int(udp_port))
+                if not entry: continue
+                _service_name, checker = entry
+                for host in hosts:
+                    probes.append(executor.submit(self._probe_udp, checker, host, udp_port))
+        return probes
+
+    def _collect_probe_results(self, probes: List[Future], config: Dict[str, Any]) -> None:
+        """Merges a finished probe cycle on the Tk thread; a port is Open if any host answered."""
+        if not all(future.done() for future in probes):
+            self.after(_PROBE_POLL_MS, self._collect_probe_cb, probes, config)
+            return
+        self._probe_running = False
+        final_results: Dict[int, str] = {}
+        for future in probes:
             try:
-                timeout = 0.2  # A shorter timeout for local checks is reasonable
-                threads = []
-                # A dict to hold results from threads, port -> list of statuses
-                threaded_results = defaultdict(list)
-
-                def _check_tcp(host, port):
-                    try:
-                        status = check_tcp_port(host, port, timeout)
-                        threaded_results[port].append(status)
-                    except Exception:
-                        threaded_results[port].append("Closed")
-
-                def _check_udp(host, port, checker):
-                    try:
-                        res = checker.check(host, timeout=timeout)
-                        status = "Open" if res and res.available else "Closed"
-                        threaded_results[port].append(status)
-                    except Exception:
-                        threaded_results[port].append("Closed")
-
-                # --- TCP Checks ---
-                for p in self._local_service_ports:
-                    threads.append(threading.Thread(target=_check_tcp, args=("127.0.0.1", p)))
-                    threads.append(threading.Thread(target=_check_tcp, args=("::1", p)))
-
-                # --- UDP Checks ---
-                udp_ports_cfg = config.get('udp_services_to_check', [])
-                if udp_ports_cfg:
-                    registry = get_udp_service_registry()
-                    for udp_port in udp_ports_cfg:
-                        entry = registry.get(int(udp_port))
-                        if not entry: continue
-                        _service_name, checker = entry
-                        threads.append(threading.Thread(target=_check_udp, args=("127.0.0.1", udp_port, checker)))
-                        threads.append(threading.Thread(target=_check_udp, args=("::1", udp_port, checker)))
-                
-                for t in threads: t.start()
-                for t in threads: t.join()
-
-                # --- Consolidate Results ---
-                final_results = {}
-                for port, statuses in threaded_results.items():
-                    final_results[port] = "Open" if "Open" in statuses else "Closed"
-
-                def _apply():
-                    try:
-                        from ...checkers import get_udp_service_registry
-                        udp_ports = set(get_udp_service_registry().keys())
-                        for p, measured_status in final_results.items():
-                            btn = self.local_service_indicators.get(p)
-                            if not btn: continue
-                            
-                            state_entry = self._service_state.setdefault(p, {"state": "Unknown", "open_streak": 0, "closed_streak": 0})
-                            if measured_status == "Open":
-                                state_entry["open_streak"] += 1
-                                state_entry["closed_streak"] = 0
-                                if state_entry["open_streak"] >= self._open_confirm_threshold:
-                                    state_entry["state"] = "Open"
-                            else:
-                                state_entry["closed_streak"] += 1
-                                state_entry["open_streak"] = 0
-                                if state_entry["closed_streak"] >= self._close_confirm_threshold:
-                                    state_entry["state"] = "Closed"
-
-                            effective_state = state_entry["state"]
-                            if effective_state == "Unknown":
-                                continue
-                            
-                            is_open = effective_state == "Open"
-                            color = (UDP_OPEN_COLOR if p in udp_ports else TCP_OPEN_COLOR) if is_open else \
-                                    (UDP_CLOSED_COLOR if p in udp_ports else TCP_CLOSED_COLOR)
-                            btn.config(bg=color)
-                    except tk.TclError:
-                        pass # Widget destroyed
-                
-                self.after(0, _apply)
-            finally:
-                setattr(self, "_local_services_thread_running", False)
-                self.after(2000, lambda: self.start_local_services_check(config)) # Check more frequently
-
-        threading.Thread(target=_worker, daemon=True).start()
+                batch = future.result()
+            except Exception as e:
+                log.debug("Local services probe failed: %s", e)
+                continue
+            for port, status in batch.items():
+                if status == "Open" or port not in final_results:
+                    final_results[port] = status
+        self._apply_local_service_results(final_results, config)
+
+    @staticmethod
+    def _probe_udp(checker: Any, host: str, port: int) -> Dict[int, str]:
+        try:
+            res = checker.check(host, timeout=_LOCAL_PROBE_TIMEOUT)
+            return {port: "Open" if res and res.available else "Closed"}
+        except Exception:
+            return {port: "Closed"}
+
+    def _apply_local_service_results(self, final_results: Dict[int, str], config: Dict[str, Any]) -> None:
+        """Applies probe results to the indicators, then schedules the next probe."""
+        try:
+            snapshot = tuple(sorted(final_results.items()))
+            repeated = snapshot == self._last_probe_snapshot
+            self._last_probe_snapshot = snapshot
+            if not (repeated and self._indicators_settled):
+                self._update_indicators(final_results)
+            self._next_probe_due = time.monotonic() + self._next_probe_interval(repeated, config)
+            self._schedule_local_services_check(config)
+        except tk.TclError:
+            pass # Widget destroyed
+
+    def _update_indicators(self, final_results: Dict[int, str]) -> None:
+        """Feeds probe results through the open/close hysteresis and recolors what changed."""
+        recolor = []
+        settled = True
+        for p, measured_status in final_results.items():
+            items = self.local_service_indicators.get(p)
+            if not items: continue
+
+            state_entry = self._service_state.setdefault(p, {"state": "Unknown", "open_streak": 0, "closed_streak": 0})
+            if measured_status == "Open":
+                state_entry["open_streak"] += 1
+                state_entry["closed_streak"] = 0
+                if state_entry["open_streak"] >= self._open_confirm_threshold:
+                    state_entry["state"] = "Open"
+            else:
+                state_entry["closed_streak"] += 1
+                state_entry["open_streak"] = 0
+                if state_entry["closed_streak"] >= self._close_confirm_threshold:
+                    state_entry["state"] = "Closed"
+
+            effective_state = state_entry["state"]
+            if effective_state == "Unknown":
+                settled = False
+                continue
+            if (effective_state == "Open") != (measured_status == "Open"):
+                # Still inside the hysteresis window; keep counting streaks
+                settled = False
+
+            open_color, closed_color = self._indicator_colors[p]
+            color = open_color if effective_state == "Open" else closed_color
+            if self._applied_colors.get(p) != color:
+                self._applied_colors[p] = color
+                recolor.append((items[0], color))
+        # All indicators live on one canvas, so a recolor is an item fill change
+        itemconfigure = self.local_services_canvas.itemconfigure
+        for rect, color in recolor:
+            itemconfigure(rect, fill=color)
+        self._indicators_settled = settled
 
     def update_info(self, info: Dict[str, Any]) -> None:
         """Updates labels with hysteresis: retain last good values on transient failures.
@@ -191,8 +321,7 @@ class NetworkInfoPanel(ttk.Frame):
         We only overwrite a field if the new value looks valid (has a digit or ':').
         Otherwise, keep cached value to prevent flicker back to 'Detecting…'.
         """
-        import logging
-        logging.info(f"NetworkInfoPanel.update_info called with: {info}")
+        log.debug("NetworkInfoPanel.update_info called with: %s", info)
         try:
             def _is_valid(val: Any) -> bool:
                 if not val or not isinstance(val, (str, int)):
@@ -203,32 +332,29 @@ class NetworkInfoPanel(ttk.Frame):
                 return any(c.isdigit() for c in s)
 
             updated = False
-            for key, label_attr, target_key in [
-                ("primary_ipv4", "netinfo_v4", "primary_ipv4"),
-                ("primary_ipv6", "netinfo_v6", "primary_ipv6"),
-                ("gateway", "netinfo_gw", "gateway"),
-                ("subnet_mask", "netinfo_mask", "subnet_mask"),
-            ]:
+            for key in self._netinfo_vars:
                 new_val = info.get(key)
                 if _is_valid(new_val):
-                    self._cached_network_info[target_key] = str(new_val)
+                    self._cached_network_info[key] = str(new_val)
                     updated = True
 
             if updated:
                 self._last_network_update = time.time()
 
             # Apply cached (or placeholders if never set)
-            v4 = self._cached_network_info.get("primary_ipv4", "n/a")
-            v6 = self._cached_network_info.get("primary_ipv6", "n/a")
-            gw = self._cached_network_info.get("gateway", "n/a")
-            mask = self._cached_network_info.get("subnet_mask", "n/a")
-            self.netinfo_v4.config(text=str(v4))
-            self.netinfo_v6.config(text=str(v6))
-            self.netinfo_gw.config(text=str(gw))
-            self.netinfo_mask.config(text=str(mask))
+            self._apply_cached_network_info()
         except tk.TclError:
             pass
 
+    def _apply_cached_network_info(self) -> None:
+        """Pushes cached values into the field variables, skipping unchanged ones."""
+        shown = self._netinfo_shown
+        for key, var in self._netinfo_vars.items():
+            value = self._cached_network_info.get(key, "n/a")
+            if shown[key] != value:
+                shown[key] = value
+                var.set(value)
+
     def retranslate_ui(self, translator: Callable[[str], str]):
         """Retranslates the UI elements of the widget."""
         self._ = translator
@@ -241,39 +367,35 @@ class NetworkInfoPanel(ttk.Frame):
         # Reapply cached values (prevents regress to placeholder on language change)
         if self._cached_network_info:
             try:
-                self.netinfo_v4.config(text=self._cached_network_info.get("primary_ipv4", "n/a"))
-                self.netinfo_v6.config(text=self._cached_network_info.get("primary_ipv6", "n/a"))
-                self.netinfo_gw.config(text=self._cached_network_info.get("gateway", "n/a"))
-                self.netinfo_mask.config(text=self._cached_network_info.get("subnet_mask", "n/a"))
+                self._apply_cached_network_info()
             except tk.TclError:
                 pass
 
     # --------------------------- Settings Refresh ---------------------------
-    def refresh_for_settings_change(self, config: Dict[str, Any]):
+    def refresh_for_settings_change(self, config: Dict[str, Any],
+                                    changed: Optional[AbstractSet[str]] = None):
         """Applies live settings adjustments without rebuilding the widget.
 
-        Currently this only needs to handle TCP port readability changes.
+        Currently this only needs to handle TCP port readability changes;
+        when changed is given, other keys are ignored.
         """
+        if changed is not None and changed.isdisjoint(PORT_LABEL_KEYS):
+            return
         try:
-            readability = config.get('tcp_port_readability', 'Numbers')
-            service_map = config.get('port_service_map', {})
+            self._port_fmt = fmt = port_label_formatter(config)
             if not self.local_service_indicators:
                 return
-            for port in self._local_service_ports:
-                btn = self.local_service_indicators.get(port)
-                if not btn:
-                    continue
-                if readability == 'Simple':
-                    btn.config(text=service_map.get(str(port), str(port)))
-                else:
-                    btn.config(text=str(port))
+            indicators = self.local_service_indicators
+            itemconfigure = self.local_services_canvas.itemconfigure
+            for p in self._local_service_ports:
+                if p in indicators:
+                    itemconfigure(indicators[p][1], text=fmt(p))
+            # Labels may have changed width
+            self._layout_local_services()
             # Re-apply cached network info (hysteresis) explicitly
             if self._cached_network_info:
                 try:
-                    self.netinfo_v4.config(text=self._cached_network_info.get("primary_ipv4", "n/a"))
-                    self.netinfo_v6.config(text=self._cached_network_info.get("primary_ipv6", "n/a"))
-                    self.netinfo_gw.config(text=self._cached_network_info.get("gateway", "n/a"))
-                    self.netinfo_mask.config(text=self._cached_network_info.get("subnet_mask", "n/a"))
+                    self._apply_cached_network_info()
                 except tk.TclError:
                     pass
         except Exception:
@@ -3,8 +3,13 @@ A widget for the application's status bar.
 """
 import tkinter as tk
 from tkinter import ttk
-import tkinter.font as tkfont
-from typing import Callable
+from typing import Callable, Optional
+
+# A font description rather than a tkfont.Font: Tk resolves and caches it
+# itself, so no named font is created (and later deleted) per build.
+_MONO_FONT = ("Courier", 10)
+_ERROR_COLOR = "red"
+_ERROR_DISPLAY_MS = 3000
 
 class StatusBar(ttk.Frame):
     """The application's status bar."""
@@ -13,17 +18,43 @@ class StatusBar(ttk.Frame):
         super().__init__(parent)
         self._ = translator
 
-        self.status_label = ttk.Label(self, text=self._("Ready."), relief=tk.SUNKEN, anchor=tk.W, padding=(2, 5))
+        self._status_text = self._("Ready.")
+        # Text to restore once a transient error message expires
+        self._resting_text = self._status_text
+        self._error_job: Optional[str] = None
+        self.status_label = ttk.Label(self, text=self._status_text, relief=tk.SUNKEN, anchor=tk.W, padding=(2, 5))
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        mono_font = tkfont.Font(family="Courier", size=10)
-        self.status_indicator = ttk.Label(self, text="💻 ? ? ? ? ? 📠", relief=tk.SUNKEN, width=15, anchor=tk.CENTER, padding=(5, 5), font=mono_font)
+        self.status_indicator = ttk.Label(self, text="💻 ? ? ? ? ? 📠", relief=tk.SUNKEN, width=15, anchor=tk.CENTER, padding=(5, 5), font=_MONO_FONT)
         self.status_indicator.pack(side=tk.RIGHT)
 
     def update_status(self, text: str):
-        """Updates the main status label."""
+        """Updates the main status label, skipping the Tk call if the text is unchanged."""
+        self._resting_text = text
+        if self._error_job is not None:
+            # A real status change replaces any error still on display
+            self.after_cancel(self._error_job)
+            self._error_job = None
+            self.status_label.config(foreground="")
+        if text == self._status_text:
+            return
+        self._status_text = text
         self.status_label.config(text=text)
 
+    def show_error(self, text: str, duration_ms: int = _ERROR_DISPLAY_MS):
+        """Shows text in red for duration_ms, then restores the previous status."""
+        if self._error_job is not None:
+            self.after_cancel(self._error_job)
+        self._status_text = text
+        self.status_label.config(text=text, foreground=_ERROR_COLOR)
+        self._error_job = self.after(duration_ms, self._clear_error)
+
+    def _clear_error(self):
+        """Restores the status that was showing before the error."""
+        self._error_job = None
+        self._status_text = self._resting_text
+        self.status_label.config(text=self._resting_text, foreground="")
+
     def set_indicator_text(self, text: str):
         """Sets the text of the status indicator."""
         self.status_indicator.config(text=text)
@@ -31,7 +62,7 @@ class StatusBar(ttk.Frame):
     def retranslate_ui(self, translator: Callable[[str], str]):
         """Retranslates the UI elements of the widget."""
         self._ = translator
-        self.status_label.config(text=self._("Ready."))
+        self.update_status(self._("Ready."))
 
     # --------------------------- Settings Refresh ---------------------------
     def refresh_for_settings_change(self):
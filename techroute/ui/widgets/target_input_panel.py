@@ -3,7 +3,14 @@ A widget for handling target input.
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Literal
+from typing import Callable, Dict, List, Literal, Tuple
+
+from .utils import split_mnemonic
+
+# Pack options shared by the paired buttons in each row: the first sits flush
+# left and its partner follows with a small gap.
+_PACK_FIRST = {'side': tk.LEFT}
+_PACK_NEXT = {'side': tk.LEFT, 'padx': (5, 0)}
 
 
 class TargetInputPanel(ttk.Frame):
@@ -12,24 +19,24 @@ class TargetInputPanel(ttk.Frame):
     def __init__(self, parent: tk.Widget, translator: Callable[[str], str]):
         super().__init__(parent)
         self._ = translator
+        # (button, '&label' msgid) pairs, re-split when the language changes
+        self._tr_buttons: List[Tuple[ttk.Button, str]] = []
 
         def create_button(parent, label, **kwargs):
-            translated_label = self._(label)
-            underline = translated_label.find('&')
-            mnemonic = None
+            kwargs['text'], underline, mnemonic = split_mnemonic(self._(label))
             if underline != -1:
-                kwargs['text'] = translated_label.replace('&', '', 1)
                 kwargs['underline'] = underline
-                mnemonic = translated_label[underline + 1].lower()
-            else:
-                kwargs['text'] = translated_label
             
             button = ttk.Button(parent, **kwargs)
+            self._tr_buttons.append((button, label))
             return button, mnemonic
 
+        # Alt-key -> button; the owning window dispatches these from one binding
+        self.mnemonics: Dict[str, ttk.Button] = {}
+
         def bind_mnemonic(widget, mnemonic):
             if mnemonic:
-                self.winfo_toplevel().bind(f'<Alt-{mnemonic}>', lambda e, w=widget: w.invoke())
+                self.mnemonics[mnemonic] = widget
 
         self.input_frame = ttk.LabelFrame(self, text=self._("Target Browser: Unknown"), padding="10")
         self.input_frame.pack(fill=tk.X, expand=True)
@@ -40,6 +47,8 @@ class TargetInputPanel(ttk.Frame):
         text_frame = ttk.Frame(self.input_frame)
         text_frame.pack(pady=5, fill=tk.X, expand=True)
         self.ip_entry = tk.Text(text_frame, width=60, height=6, wrap="word")
+        # Mirrors the entry's state so callers needn't ask Tk with cget
+        self.editable = True
         self.ip_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.ip_entry.focus()
         vscrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.ip_entry.yview)
@@ -52,10 +61,10 @@ class TargetInputPanel(ttk.Frame):
         left_quick_frame = ttk.Frame(quick_row)
         left_quick_frame.pack(side=tk.LEFT)
         self.add_localhost_button, localhost_mnemonic = create_button(left_quick_frame, "Add l&ocalhost")
-        self.add_localhost_button.pack(side=tk.LEFT)
+        self.add_localhost_button.pack(**_PACK_FIRST)
         bind_mnemonic(self.add_localhost_button, localhost_mnemonic)
         self.add_gateway_button, gateway_mnemonic = create_button(left_quick_frame, "Add &Gateway")
-        self.add_gateway_button.pack(side=tk.LEFT, padx=(5, 0))
+        self.add_gateway_button.pack(**_PACK_NEXT)
         bind_mnemonic(self.add_gateway_button, gateway_mnemonic)
 
         spacer = ttk.Frame(quick_row)
@@ -73,10 +82,10 @@ class TargetInputPanel(ttk.Frame):
         left_button_group = ttk.Frame(button_frame)
         left_button_group.pack(side=tk.LEFT)
         self.start_stop_button, start_stop_mnemonic = create_button(left_button_group, "&Start Pinging")
-        self.start_stop_button.pack(side=tk.LEFT)
+        self.start_stop_button.pack(**_PACK_FIRST)
         bind_mnemonic(self.start_stop_button, start_stop_mnemonic)
         self.launch_all_button, launch_all_mnemonic = create_button(left_button_group, "&Launch Web UIs", state=tk.DISABLED)
-        self.launch_all_button.pack(side=tk.LEFT, padx=(5, 0))
+        self.launch_all_button.pack(**_PACK_NEXT)
         bind_mnemonic(self.launch_all_button, launch_all_mnemonic)
 
         right_button_group = ttk.Frame(button_frame)
@@ -90,13 +99,15 @@ class TargetInputPanel(ttk.Frame):
 
     def set_state(self, state: Literal['normal', 'disabled']):
         self.ip_entry.config(state=state)
+        self.editable = state == tk.NORMAL
 
     def clear(self):
         self.ip_entry.delete("1.0", tk.END)
 
     def append_line(self, text: str):
-        content = self.ip_entry.get("1.0", "end-1c")
-        prefix = "\n" if content and not content.endswith("\n") else ""
+        # Only the last character decides the separator; no need to read it all
+        last_char = self.ip_entry.get("end-2c", "end-1c")
+        prefix = "\n" if last_char and last_char != "\n" else ""
         self.ip_entry.insert("end", prefix + text + "\n")
         self.ip_entry.see("end")
 
@@ -109,12 +120,13 @@ class TargetInputPanel(ttk.Frame):
         self._ = translator
         # The browser name will be updated by `update_browser_name`
         self.instruction_label.config(text=self._("Enter IPs or Hostnames, one per line"))
-        self.add_localhost_button.config(text=self._("Add localhost"))
-        self.add_gateway_button.config(text=self._("Add Gateway"))
-        self.clear_field_button.config(text=self._("Clear Field"))
-        self.start_stop_button.config(text=self._("Start Pinging"))
-        self.launch_all_button.config(text=self._("Launch Web UIs"))
-        self.clear_statuses_button.config(text=self._("Clear Statuses"))
+        # Mnemonic letters can move with the language, so re-register them
+        self.mnemonics.clear()
+        for button, label in self._tr_buttons:
+            text, underline, mnemonic = split_mnemonic(self._(label))
+            button.config(text=text, underline=underline)
+            if mnemonic:
+                self.mnemonics[mnemonic] = button
 
     # --------------------------- Settings Refresh ---------------------------
     def refresh_for_settings_change(self):
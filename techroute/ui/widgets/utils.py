@@ -2,21 +2,69 @@
 Shared utility functions for UI widgets.
 """
 from __future__ import annotations
-from typing import Any
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Optional, Tuple
 import tkinter as tk
 
+from ..styling import INDICATOR_BUTTON_OPTIONS
+
 
 def create_indicator_button(parent: Any, text: str) -> Any:
     """Creates a styled tk.Button for use as a status indicator."""
-    return tk.Button(
-        parent,
-        text=text,
-        width=len(text) + 1,
-        bg="gray",
-        fg="white",
-        disabledforeground="white",
-        relief="raised",
-        borderwidth=1,
-        state=tk.DISABLED,
-        cursor=""
-    )
+    return tk.Button(parent, text=text, width=len(text) + 1, **INDICATOR_BUTTON_OPTIONS)
+
+
+# Config keys that change how a port indicator is labelled
+PORT_LABEL_KEYS = frozenset({'tcp_port_readability', 'port_service_map'})
+
+
+def changed_config_keys(old: Dict[str, Any], new: Dict[str, Any]) -> AbstractSet[str]:
+    """Returns the top-level keys whose values differ between two configs."""
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+def port_label_formatter(config: Dict[str, Any]) -> Callable[[Any], str]:
+    """Returns a function mapping a port to its indicator label under config.
+
+    The readability mode is resolved here once, so callers can format many
+    ports without re-reading the settings for each one.
+    """
+    if config.get('tcp_port_readability', 'Numbers') != 'Simple':
+        return str
+    service_map = config.get('port_service_map', {})
+
+    def _simple(port: Any) -> str:
+        key = str(port)
+        return service_map.get(key, key)
+    return _simple
+
+
+def split_mnemonic(translated_label: str) -> Tuple[str, int, Optional[str]]:
+    """Splits '&File' style labels into (text, underline index, mnemonic key)."""
+    underline = translated_label.find('&')
+    if underline == -1:
+        return translated_label, -1, None
+    if underline == len(translated_label) - 1:
+        # A trailing '&' (e.g. a bad translation) marks no letter
+        return translated_label[:-1], -1, None
+    return translated_label.replace('&', '', 1), underline, translated_label[underline + 1].lower()
+
+
+def configure_many(widget: Any, option: str, pairs: Iterable[Tuple[Any, str]]) -> None:
+    """Sets one option on many widgets with a single Tcl command.
+
+    pairs holds (widget, value) tuples; widget is only used for its interpreter.
+    """
+    flat = tuple(item for w, value in pairs for item in (str(w), value))
+    if flat:
+        # An anonymous Tcl proc keeps the loop variables out of the global namespace
+        widget.tk.call('apply', ('pairs', f'foreach {{w v}} $pairs {{$w configure -{option} $v}}'), flat)
+
+
+def place_forget_many(widget: Any, widgets: Iterable[Any]) -> None:
+    """Unplaces many widgets with a single Tcl command.
+
+    widget is only used for its interpreter.
+    """
+    paths = tuple(str(w) for w in widgets)
+    if paths:
+        widget.tk.call('apply', ('paths', 'foreach w $paths {place forget $w}'), paths)
@@ -0,0 +1,42 @@
+import socket
+
+import pytest
+
+from techroute.network import check_tcp_ports
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        yield server.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+    # Bound and released without listening, so nothing accepts on it
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_open_port(listening_port):
+    assert check_tcp_ports("127.0.0.1", [listening_port], 1.0) == {listening_port: "Open"}
+
+
+def test_closed_port(closed_port):
+    assert check_tcp_ports("127.0.0.1", [closed_port], 0.5) == {closed_port: "Closed"}
+
+
+def test_open_and_closed_in_one_batch(listening_port, closed_port):
+    results = check_tcp_ports("127.0.0.1", [listening_port, closed_port], 1.0)
+    assert results == {listening_port: "Open", closed_port: "Closed"}
+
+
+def test_unresolvable_host():
+    assert check_tcp_ports("no-such-host.invalid", [80, 443], 0.5) == {80: "Hostname Error", 443: "Hostname Error"}
+
+
+def test_empty_port_list():
+    assert check_tcp_ports("127.0.0.1", [], 0.5) == {}
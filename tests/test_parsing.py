@@ -0,0 +1,73 @@
+from techroute.parsing import TargetParser
+
+
+def _counting_parser(monkeypatch, default_ports):
+    parser = TargetParser(default_ports)
+    calls = []
+    original = parser._parse_and_validate
+
+    def counting(ip_string):
+        calls.append(ip_string)
+        return original(ip_string)
+
+    monkeypatch.setattr(parser, "_parse_and_validate", counting)
+    return parser, calls
+
+
+def test_parse_merges_default_ports():
+    targets = TargetParser([80, 443]).parse_and_validate_targets("192.168.1.1:8080\nexample.com")
+    assert [t['original_string'] for t in targets] == ["192.168.1.1:8080", "example.com"]
+    assert targets[0]['ports'] == [80, 443, 8080]
+    assert targets[1]['ports'] == [80, 443]
+
+
+def test_unchanged_input_is_memoized(monkeypatch):
+    parser, calls = _counting_parser(monkeypatch, [80])
+    first = parser.parse_and_validate_targets("10.0.0.1")
+    second = parser.parse_and_validate_targets("10.0.0.1")
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_memoized_result_is_a_fresh_copy(monkeypatch):
+    parser, _calls = _counting_parser(monkeypatch, [80])
+    parser.parse_and_validate_targets("10.0.0.1")[0]['ports'].append(9999)
+    assert parser.parse_and_validate_targets("10.0.0.1")[0]['ports'] == [80]
+
+
+def test_changed_input_or_default_ports_reparse(monkeypatch):
+    parser, calls = _counting_parser(monkeypatch, [80])
+    parser.parse_and_validate_targets("10.0.0.1")
+    parser.parse_and_validate_targets("10.0.0.2")
+    parser.default_ports = [80, 443]
+    assert parser.parse_and_validate_targets("10.0.0.2")[0]['ports'] == [80, 443]
+    assert len(calls) == 3
+
+
+def test_clear_cache_forces_reparse(monkeypatch):
+    parser, calls = _counting_parser(monkeypatch, [80])
+    parser.parse_and_validate_targets("10.0.0.1")
+    parser.clear_cache()
+    parser.parse_and_validate_targets("10.0.0.1")
+    assert len(calls) == 2
+
+
+def test_extract_host_strips_ports():
+    assert TargetParser.extract_host("example.com:80,443") == "example.com"
+    assert TargetParser.extract_host(" 192.168.1.1:8080 ") == "192.168.1.1"
+    assert TargetParser.extract_host("[2001:db8::1]:443") == "2001:db8::1"
+    assert TargetParser.extract_host("[fe80::1%eth0]:22") == "fe80::1%eth0"
+
+
+def test_extract_host_keeps_ipv6_literals_whole():
+    assert TargetParser.extract_host("2001:db8::1") == "2001:db8::1"
+    assert TargetParser.extract_host("::ffff:192.0.2.1") == "::ffff:192.0.2.1"
+    assert TargetParser.extract_host("fe80::1%eth0") == "fe80::1%eth0"
+    # ipaddress accepts any scope id, colons included
+    assert TargetParser.extract_host("fe80::1%eth0:80") == "fe80::1%eth0:80"
+
+
+def test_extract_host_splits_colons_that_are_not_ipv6():
+    assert TargetParser.extract_host("abc:def:80") == "abc"
+    assert TargetParser.extract_host("1:2:3") == "1"
+    assert TargetParser.extract_host("1::2::3") == "1"
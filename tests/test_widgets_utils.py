@@ -0,0 +1,34 @@
+from techroute.ui.widgets.utils import changed_config_keys, port_label_formatter, split_mnemonic
+
+
+def test_split_mnemonic_marks_letter():
+    assert split_mnemonic("&File") == ("File", 0, "f")
+    assert split_mnemonic("Add l&ocalhost") == ("Add localhost", 5, "o")
+
+
+def test_split_mnemonic_without_marker():
+    assert split_mnemonic("Status") == ("Status", -1, None)
+
+
+def test_split_mnemonic_trailing_ampersand():
+    assert split_mnemonic("End&") == ("End", -1, None)
+
+
+def test_port_label_formatter_numbers():
+    fmt = port_label_formatter({'tcp_port_readability': 'Numbers'})
+    assert fmt(80) == "80"
+    assert port_label_formatter({})(443) == "443"
+
+
+def test_port_label_formatter_simple():
+    fmt = port_label_formatter({'tcp_port_readability': 'Simple', 'port_service_map': {'80': 'HTTP'}})
+    assert fmt(80) == "HTTP"
+    assert fmt("80") == "HTTP"
+    assert fmt(8081) == "8081"  # Unmapped ports fall back to the number
+
+
+def test_changed_config_keys():
+    old = {'language': 'en', 'ui_theme': 'Light', 'removed': 1}
+    new = {'language': 'en', 'ui_theme': 'Dark', 'added': 2}
+    assert changed_config_keys(old, new) == {'ui_theme', 'removed', 'added'}
+    assert changed_config_keys(old, dict(old)) == set()